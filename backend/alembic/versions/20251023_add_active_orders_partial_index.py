@@ -0,0 +1,38 @@
+"""add_active_orders_partial_index
+
+Revision ID: 20251023_active_orders_idx
+Revises: 20250122_cancellation
+Create Date: 2025-10-23 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20251023_active_orders_idx'
+down_revision: Union[str, None] = '20250122_cancellation'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add a partial index on orders for active-order lookups
+
+    Pending-order queries filter by bot_id AND status IN (PENDING, PARTIALLY_FILLED).
+    Indexing only those rows keeps the index tiny regardless of order history size.
+    Check with: EXPLAIN (ANALYZE, BUFFERS) on the pending-orders query.
+    """
+    op.create_index(
+        'ix_orders_active',
+        'orders',
+        ['bot_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text("status IN ('PENDING', 'PARTIALLY_FILLED')")
+    )
+
+
+def downgrade() -> None:
+    """Remove the active-orders partial index"""
+    op.drop_index('ix_orders_active', table_name='orders')
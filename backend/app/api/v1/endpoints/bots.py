@@ -9,7 +9,7 @@ from app.db.session import get_db
 from app.models.user import User
 from app.models.bot import Bot, ActivityLog, BotStatus, OrderSide as BotOrderSide
 from app.dependencies.auth import get_current_active_user
-from app.models.order import Order as OrderModel, OrderStatus as DBOrderStatus, OrderType as DBOrderType
+from app.models.order import Order as OrderModel, OrderStatus as DBOrderStatus, OrderType as DBOrderType, ACTIVE_ORDER_STATUSES
 from app.schemas.bot import (
     BotCreate,
     BotUpdate,
@@ -23,7 +23,7 @@ from app.schemas.order import OrderResponse
 from app.services.telegram import telegram_service
 from app.services.order_service import place_order_for_bot, get_exchange_for_bot as get_exchange_adapter
 from app.services.websocket_manager import ws_manager
-from app.exchanges import ExchangeFactory, OrderRequest, OrderSide, OrderType, BaseExchange
+from app.exchanges import OrderRequest, OrderSide, OrderType, BaseExchange
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -42,22 +42,13 @@ def get_exchange_for_bot(bot: Bot) -> BaseExchange:
     Raises:
         ValueError: If exchange is not supported or credentials missing
     """
-    # Map bot exchange to exchange name for factory
-    exchange_map = {
-        "CoinDCX F": "coindcx",
-        "Binance": "binance",
-    }
-
-    exchange_name = exchange_map.get(bot.exchange.value)
-    if not exchange_name:
-        raise ValueError(f"Exchange {bot.exchange.value} not supported")
-
-    # Create exchange adapter
+    # Shared adapter from the order service (one per exchange, not per request)
     try:
-        exchange = ExchangeFactory.create_sync(exchange_name)
-        return exchange
+        return get_exchange_adapter(bot)
+    except ValueError:
+        raise
     except Exception as e:
-        logger.error(f"Failed to create exchange adapter for {exchange_name}: {e}")
+        logger.error(f"Failed to create exchange adapter for {bot.exchange.value}: {e}")
         raise ValueError(f"Failed to initialize exchange: {str(e)}")
 
 
@@ -314,7 +305,7 @@ async def update_bot(
             orders_result = await db.execute(
                 select(OrderModel).where(
                     OrderModel.bot_id == bot_id,
-                    OrderModel.status.in_([DBOrderStatus.PENDING, DBOrderStatus.PARTIALLY_FILLED])
+                    OrderModel.status.in_(ACTIVE_ORDER_STATUSES)
                 )
             )
             pending_orders = orders_result.scalars().all()
@@ -13,12 +13,20 @@ import logging
 from app.exchanges.coindcx.client import CoinDCXFutures
 from app.db.session import AsyncSessionLocal
 from app.services.order_monitor import process_order_fill
+from app.services.order_service import (
+    GET_ORDER_BY_EXCHANGE_ID,
+    GET_BOT_ID_BY_EXCHANGE_ORDER_ID,
+    GET_BOT_BY_ID
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Cancellation reasons set by our own UPDATE/STOP/DELETE flows (bot must keep running)
+SYSTEM_CANCELLATION_REASONS = frozenset({"UPDATE", "STOP", "DELETE"})
+
 # Track active WebSocket connections
 active_connections: Set[WebSocket] = set()
 
@@ -30,6 +38,8 @@ class ConnectionManager:
         self.active_connections: Set[WebSocket] = set()
         self.coindcx_client: CoinDCXFutures | None = None
         self.coindcx_connected: bool = False
+        # In-flight background order-processing tasks
+        self._order_tasks: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection"""
@@ -116,6 +126,30 @@ class ConnectionManager:
                 self.coindcx_client = None
                 self.coindcx_connected = False
 
+    def _spawn_order_task(self, coro) -> asyncio.Task:
+        """
+        Run order processing in a tracked background task
+
+        Keeping a reference stops the task from being garbage collected mid-flight
+        and lets shutdown() cancel everything still in progress in one pass.
+        """
+        task = asyncio.create_task(coro)
+        self._order_tasks.add(task)
+        task.add_done_callback(self._order_tasks.discard)
+        return task
+
+    async def shutdown(self):
+        """Cancel in-flight order tasks concurrently and disconnect from CoinDCX"""
+        tasks = list(self._order_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            # Failures in one task must not stop the others from being reaped
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"Cancelled {len(tasks)} in-flight order task(s)")
+
+        await self.disconnect_coindcx()
+
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
         disconnected = set()
@@ -163,16 +197,14 @@ class ConnectionManager:
             # Query database to get bot_id for this order
             bot_id = None
             try:
-                from app.models.order import Order as OrderModel
-                from sqlalchemy import select
-
                 async with AsyncSessionLocal() as db:
+                    # Only bot_id is needed here - select the one column instead of the whole row
                     result = await db.execute(
-                        select(OrderModel).where(OrderModel.exchange_order_id == order_id)
+                        GET_BOT_ID_BY_EXCHANGE_ORDER_ID, {"exchange_order_id": order_id}
                     )
-                    order = result.scalar_one_or_none()
-                    if order:
-                        bot_id = str(order.bot_id)
+                    order_bot_id = result.scalar_one_or_none()
+                    if order_bot_id:
+                        bot_id = str(order_bot_id)
                         logger.info(f"📋 [ORDER INFO] Bot ID: {bot_id}")
                     else:
                         logger.warning(f"⚠️ [ORDER INFO] Order {order_id} not found in database")
@@ -231,7 +263,7 @@ class ConnectionManager:
 
                     # Process the fill in a background task to avoid blocking WebSocket
                     logger.info(f"🚀 [ASYNC] Creating background task for opposite order placement...")
-                    asyncio.create_task(self._process_filled_order(
+                    self._spawn_order_task(self._process_filled_order(
                         exchange_order_id=order_id,
                         filled_quantity=filled_qty,
                         total_quantity=total_qty,
@@ -250,7 +282,7 @@ class ConnectionManager:
 
                 # Process cancellation in background task
                 logger.info(f"🚀 [ASYNC] Creating background task for cancellation handling...")
-                asyncio.create_task(self._process_cancelled_order(
+                self._spawn_order_task(self._process_cancelled_order(
                     exchange_order_id=order_id
                 ))
                 logger.info(f"✅ [ASYNC] Cancellation handler task created successfully")
@@ -354,14 +386,13 @@ class ConnectionManager:
                 logger.info(f"✅ [DB] Database session created successfully")
 
                 # Import models
-                from app.models.order import Order as OrderModel, OrderStatus
-                from app.models.bot import Bot, BotStatus, ActivityLog
-                from sqlalchemy import select
+                from app.models.order import OrderStatus
+                from app.models.bot import BotStatus, ActivityLog
 
                 # Find the order
                 logger.info(f"🔍 [DB] Searching for order {exchange_order_id}...")
                 result = await db.execute(
-                    select(OrderModel).where(OrderModel.exchange_order_id == exchange_order_id)
+                    GET_ORDER_BY_EXCHANGE_ID, {"exchange_order_id": exchange_order_id}
                 )
                 order = result.scalar_one_or_none()
 
@@ -377,7 +408,7 @@ class ConnectionManager:
                 logger.info(f"✅ [CANCELLED] Order status updated to CANCELLED")
 
                 # CHECK CANCELLATION REASON - Don't auto-stop for system cancellations
-                if order.cancellation_reason in ["UPDATE", "STOP", "DELETE"]:
+                if order.cancellation_reason in SYSTEM_CANCELLATION_REASONS:
                     logger.info(f"ℹ️ ========== SYSTEM-INITIATED CANCELLATION ==========")
                     logger.info(f"ℹ️ [CANCELLED] Reason: {order.cancellation_reason}")
                     logger.info(f"ℹ️ [CANCELLED] This is expected - bot operation in progress")
@@ -406,7 +437,7 @@ class ConnectionManager:
 
                 # Get the bot
                 logger.info(f"🔍 [DB] Fetching bot {order.bot_id}...")
-                bot_result = await db.execute(select(Bot).where(Bot.id == order.bot_id))
+                bot_result = await db.execute(GET_BOT_BY_ID, {"bot_id": order.bot_id})
                 bot = bot_result.scalar_one_or_none()
 
                 if not bot:
@@ -63,6 +63,11 @@ class Settings(BaseSettings):
     TELEGRAM_BOT_TOKEN: Optional[str] = None
     TELEGRAM_WEBHOOK_URL: Optional[str] = None
 
+    @property
+    def SYNC_DATABASE_URL(self) -> str:
+        """DATABASE_URL with the psycopg2 driver, for one-shot sync scripts"""
+        return self.DATABASE_URL.replace("+asyncpg", "+psycopg2", 1)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
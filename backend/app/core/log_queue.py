@@ -0,0 +1,38 @@
+"""
+Queue-based logging for asyncio scripts
+
+Log records are handed to a queue on the calling thread and written by a
+QueueListener thread, so a coroutine that logs (e.g. a traceback from
+log.exception) never blocks the event loop on stderr.
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def start_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Move the root logger's handlers behind a queue and start the writer thread
+
+    Any handlers already configured on the root logger (basicConfig is applied
+    first if there are none) are driven by the listener instead.
+
+    Args:
+        level: Root logger level
+
+    Returns:
+        The started QueueListener - call stop() on exit to flush pending records
+    """
+    logging.basicConfig(level=level)
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    handlers = [handler for handler in root.handlers if not isinstance(handler, QueueHandler)]
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
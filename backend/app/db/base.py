@@ -0,0 +1,10 @@
+"""
+Declarative base for the ORM models
+
+Kept apart from app.db.session so that importing the models does not create
+the async engine (and import asyncpg) - e.g. in the sync one-shot scripts.
+"""
+from sqlalchemy.orm import declarative_base
+
+# Create declarative base
+Base = declarative_base()
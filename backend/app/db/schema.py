@@ -0,0 +1,71 @@
+"""
+Schema creation helpers for fresh databases
+
+create_all() sends one statement per enum type, table and index. For an empty
+database the whole schema can be compiled up front and sent in one round trip.
+VERIFY_SCHEMA_SQL checks the result (tables and orders columns) in one query.
+"""
+from sqlalchemy import Enum, MetaData
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql.base import CreateEnumType
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+# One round trip for all verification facts: public tables, then orders columns
+VERIFY_SCHEMA_SQL = """
+    SELECT 'table' AS kind, table_name::text, NULL::text AS column_name,
+           NULL::text AS data_type, NULL::text AS is_nullable, 0 AS ordinal_position
+    FROM information_schema.tables
+    WHERE table_schema = 'public'
+    UNION ALL
+    SELECT 'column', table_name::text, column_name::text,
+           data_type::text, is_nullable::text, ordinal_position::int
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = 'orders'
+    ORDER BY kind DESC, table_name, ordinal_position;
+"""
+
+
+def compile_create_schema(metadata: MetaData) -> str:
+    """
+    Compile CREATE TYPE / CREATE TABLE / CREATE INDEX DDL for all tables in metadata
+
+    Enum types are emitted once per name, before the tables that use them.
+    Tables follow metadata.sorted_tables (foreign key dependency order).
+
+    Args:
+        metadata: MetaData holding the models' tables
+
+    Returns:
+        A single PostgreSQL DDL script
+    """
+    dialect = postgresql.dialect()
+
+    enum_types = {}
+    for table in metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, Enum) and column.type.name not in enum_types:
+                enum_types[column.type.name] = column.type.dialect_impl(dialect)
+
+    statements = [str(CreateEnumType(enum_type).compile(dialect=dialect)) for enum_type in enum_types.values()]
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        statements.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes)
+
+    return ";\n".join(statements) + ";"
+
+
+async def create_schema(conn: AsyncConnection, metadata: MetaData) -> None:
+    """
+    Create every table in metadata on an empty database in one round trip
+
+    The script goes straight to asyncpg: without bind parameters it uses the
+    simple query protocol, which accepts multiple statements (SQLAlchemy's
+    asyncpg adapter prepares each statement and would reject it).
+
+    Args:
+        conn: Connection to the (empty) target database
+        metadata: MetaData holding the models' tables
+    """
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.execute(compile_create_schema(metadata))
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.db.base import Base  # noqa: F401 - re-exported for existing imports
 
 # Create async engine
 engine = create_async_engine(
@@ -19,9 +19,6 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Create declarative base
-Base = declarative_base()
-
 
 async def get_db() -> AsyncSession:
     """
@@ -282,6 +282,13 @@ class BaseExchange(ABC):
         except Exception:
             return False
 
+    async def close(self) -> None:
+        """
+        Release network resources (HTTP sessions, connection pools) held by the adapter
+
+        Default implementation does nothing.
+        """
+
     def __str__(self) -> str:
         """String representation"""
         return f"{self.exchange_name}(testnet={self.testnet})"
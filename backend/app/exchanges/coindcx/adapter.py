@@ -3,6 +3,8 @@ CoinDCX Futures Exchange Adapter
 Wraps the CoinDCX Futures client to implement BaseExchange interface
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Dict, List, Optional
 from app.exchanges.base import (
     BaseExchange,
@@ -20,6 +22,54 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# CoinDCX order status -> standard OrderStatus (built once, not per response)
+_STATUS_MAPPING = {
+    'open': OrderStatus.OPEN,
+    'filled': OrderStatus.FILLED,
+    'cancelled': OrderStatus.CANCELLED,
+    'rejected': OrderStatus.REJECTED,
+    'untriggered': OrderStatus.OPEN,
+    'initial': OrderStatus.OPEN
+}
+
+# Raw CoinDCX order fields kept in OrderResponse.exchange_specific. Everything else
+# is already mapped onto the standard fields (or unused), so the rest is dropped.
+_EXCHANGE_SPECIFIC_KEYS = (
+    'client_order_id',
+    'status',
+    'time_in_force',
+    'leverage',
+    'fee_amount',
+    'display_message',
+    'created_at',
+    'updated_at',
+)
+
+
+def _trim_exchange_specific(order_data: Dict) -> Dict:
+    """Keep only the allowlisted raw fields of a CoinDCX order payload"""
+    return {k: order_data[k] for k in _EXCHANGE_SPECIFIC_KEYS if k in order_data}
+
+
+# Symbol conversions are pure and the set of traded symbols is small, so they are
+# cached at module level (shared by all adapter instances, no reference to self)
+@lru_cache(maxsize=1024)
+def _normalize_symbol(symbol: str) -> str:
+    """ETH/USDT -> B-ETH_USDT (other formats are returned unchanged)"""
+    if '/' in symbol:
+        base, quote = symbol.split('/')
+        return f"B-{base}_{quote}"
+    return symbol
+
+
+@lru_cache(maxsize=1024)
+def _denormalize_symbol(exchange_symbol: str) -> str:
+    """B-ETH_USDT -> ETH/USDT (other formats are returned unchanged)"""
+    if exchange_symbol.startswith('B-'):
+        parts = exchange_symbol[2:].split('_')
+        return f"{parts[0]}/{parts[1]}"
+    return exchange_symbol
+
 
 @ExchangeRegistry.register("coindcx", "coindcx_futures", "CoinDCX F")
 class CoinDCXAdapter(BaseExchange):
@@ -40,6 +90,11 @@ class CoinDCXAdapter(BaseExchange):
 
         logger.info(f"CoinDCX Futures adapter initialized (testnet={testnet})")
 
+    async def close(self) -> None:
+        """Close the client's HTTP sessions and async connection pool"""
+        self.client.close()
+        await self.client.aclose()
+
     async def place_order(self, order: OrderRequest) -> OrderResponse:
         """Place order on CoinDCX Futures"""
         try:
@@ -80,7 +135,7 @@ class CoinDCXAdapter(BaseExchange):
                 price=order.price,
                 average_price=float(order_data['avg_price']) if order_data.get('avg_price') else None,
                 timestamp=order_data.get('created_at', ''),
-                exchange_specific=order_data
+                exchange_specific=_trim_exchange_specific(order_data)
             )
 
             logger.info(f"Order placed successfully: {order_response.order_id}")
@@ -93,7 +148,7 @@ class CoinDCXAdapter(BaseExchange):
     async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """Cancel order on CoinDCX"""
         try:
-            self.client.cancel_order(order_id)
+            await asyncio.to_thread(self.client.cancel_order, order_id)
             logger.info(f"Order cancelled: {order_id}")
             return True
         except Exception as e:
@@ -120,7 +175,8 @@ class CoinDCXAdapter(BaseExchange):
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[OrderResponse]:
         """Get all open orders"""
         try:
-            orders = self.client.get_orders(status="open", size=100)
+            # The client is blocking (requests); run it off the event loop
+            orders = await asyncio.to_thread(self.client.get_orders, status="open", size=100)
 
             result = []
             for order_data in orders:
@@ -139,7 +195,7 @@ class CoinDCXAdapter(BaseExchange):
         """Get position for a symbol"""
         try:
             coindcx_symbol = self.normalize_symbol(symbol)
-            positions = self.client.get_positions(size=100)
+            positions = await asyncio.to_thread(self.client.get_positions, size=100)
 
             for pos in positions:
                 if pos.pair == coindcx_symbol and pos.active_pos != 0:
@@ -156,7 +212,7 @@ class CoinDCXAdapter(BaseExchange):
                         current_price=current_price,
                         unrealized_pnl=unrealized_pnl,
                         realized_pnl=0.0,  # CoinDCX doesn't provide this directly
-                        leverage=find_position_leverage(self.client, coindcx_symbol),
+                        leverage=await asyncio.to_thread(find_position_leverage, self.client, coindcx_symbol),
                         liquidation_price=pos.liquidation_price
                     )
 
@@ -178,7 +234,7 @@ class CoinDCXAdapter(BaseExchange):
         """Get current market price"""
         try:
             coindcx_symbol = self.normalize_symbol(symbol)
-            price = get_current_price(self.client, coindcx_symbol)
+            price = await asyncio.to_thread(get_current_price, self.client, coindcx_symbol)
             return price
         except Exception as e:
             logger.error(f"Failed to get current price for {symbol}: {e}")
@@ -189,32 +245,18 @@ class CoinDCXAdapter(BaseExchange):
         Convert standard format to CoinDCX format
         ETH/USDT -> B-ETH_USDT
         """
-        if '/' in symbol:
-            base, quote = symbol.split('/')
-            return f"B-{base}_{quote}"
-        return symbol
+        return _normalize_symbol(symbol)
 
     def denormalize_symbol(self, exchange_symbol: str) -> str:
         """
         Convert CoinDCX format to standard format
         B-ETH_USDT -> ETH/USDT
         """
-        if exchange_symbol.startswith('B-'):
-            parts = exchange_symbol[2:].split('_')
-            return f"{parts[0]}/{parts[1]}"
-        return exchange_symbol
+        return _denormalize_symbol(exchange_symbol)
 
     def _map_status(self, coindcx_status: str) -> OrderStatus:
         """Map CoinDCX status to standard OrderStatus"""
-        mapping = {
-            'open': OrderStatus.OPEN,
-            'filled': OrderStatus.FILLED,
-            'cancelled': OrderStatus.CANCELLED,
-            'rejected': OrderStatus.REJECTED,
-            'untriggered': OrderStatus.OPEN,
-            'initial': OrderStatus.OPEN
-        }
-        return mapping.get(coindcx_status.lower(), OrderStatus.OPEN)
+        return _STATUS_MAPPING.get(coindcx_status.lower(), OrderStatus.OPEN)
 
     def _convert_order_response(self, order_data: Dict) -> OrderResponse:
         """Convert CoinDCX order to standard OrderResponse"""
@@ -229,7 +271,7 @@ class CoinDCXAdapter(BaseExchange):
             price=float(order_data['price']) if order_data.get('price') else None,
             average_price=float(order_data['avg_price']) if order_data.get('avg_price') else None,
             timestamp=order_data.get('created_at', ''),
-            exchange_specific=order_data
+            exchange_specific=_trim_exchange_specific(order_data)
         )
 
 
@@ -8,6 +8,9 @@ import hashlib
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
+import orjson
 import asyncio
 import socketio
 import aiohttp
@@ -26,6 +29,24 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Max keep-alive connections per host in the shared requests session
+HTTP_POOL_MAXSIZE = 32
+
+
+class OrjsonCodec:
+    """
+    orjson-backed JSON module for python-socketio (AsyncClient(json=OrjsonCodec))
+
+    Socket.IO encodes with dumps(data, separators=...), so extra keyword
+    arguments are accepted and ignored (orjson output is always compact).
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = staticmethod(orjson.loads)
+
 
 class OrderType(Enum):
     MARKET_ORDER = "market_order"
@@ -49,6 +70,10 @@ class OrderStatus(Enum):
     INITIAL = "initial"
 
 
+# Order types that must carry a limit price
+PRICED_ORDER_TYPES = frozenset({"limit_order", "stop_limit", "take_profit_limit"})
+
+
 class TimeInForce(Enum):
     GOOD_TILL_CANCEL = "good_till_cancel"
     IMMEDIATE_OR_CANCEL = "immediate_or_cancel"
@@ -102,6 +127,19 @@ class CoinDCXFutures:
         self.base_url = os.getenv('API_BASE_URL', 'https://api.coindcx.com')
         self.websocket_url = os.getenv('WEBSOCKET_URL', 'wss://stream.coindcx.com')
         
+        # Keep-alive HTTP session shared by every thread. Adapters call this client
+        # from several asyncio.to_thread workers at once: urllib3's connection pool
+        # is thread-safe for concurrent get/post, and the session carries no state
+        # that changes per request (no cookies, auth is in per-request headers).
+        # The pool is sized for the default to_thread executor (at most 32 workers).
+        self.session = requests.Session()
+        pool = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', pool)
+        self.session.mount('http://', pool)
+        
+        # Pooled async HTTP client for the async request path (created on first use)
+        self._http: Optional[httpx.AsyncClient] = None
+        
         # WebSocket client (will be initialized when needed)
         self.sio = None
         self.ws_connected = False
@@ -111,6 +149,10 @@ class CoinDCXFutures:
         
         logger.info("CoinDCX Futures client initialized")
     
+    def close(self):
+        """Close the HTTP session (the async pool is closed by aclose())"""
+        self.session.close()
+    
     def _generate_signature(self, body: dict) -> str:
         """Generate HMAC SHA256 signature for API requests"""
         secret_bytes = bytes(self.secret_key, encoding='utf-8')
@@ -126,10 +168,8 @@ class CoinDCXFutures:
             'X-AUTH-SIGNATURE': signature
         }
     
-    def _make_request(self, method: str, endpoint: str, body: dict = None) -> dict:
-        """Make HTTP request to CoinDCX API"""
-        url = f"{self.base_url}{endpoint}"
-        
+    def _sign_body(self, body: dict = None) -> tuple:
+        """Timestamp and sign a request body; returns (json_body, headers)"""
         if body is None:
             body = {}
         
@@ -138,14 +178,18 @@ class CoinDCXFutures:
         
         # Generate signature
         signature = self._generate_signature(body)
-        headers = self._get_headers(signature)
+        return json.dumps(body, separators=(',', ':')), self._get_headers(signature)
+    
+    def _make_request(self, method: str, endpoint: str, body: dict = None) -> dict:
+        """Make HTTP request to CoinDCX API"""
+        url = f"{self.base_url}{endpoint}"
+        json_body, headers = self._sign_body(body)
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers)
+                response = self.session.get(url, headers=headers)
             elif method == 'POST':
-                json_body = json.dumps(body, separators=(',', ':'))
-                response = requests.post(url, data=json_body, headers=headers)
+                response = self.session.post(url, data=json_body, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -156,18 +200,72 @@ class CoinDCXFutures:
             logger.error(f"API request failed: {e}")
             raise
     
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the pooled async HTTP client, creating it on first use"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+        return self._http
+    
+    async def _make_request_async(self, method: str, endpoint: str, body: dict = None) -> dict:
+        """Async version of _make_request over the pooled httpx client"""
+        url = f"{self.base_url}{endpoint}"
+        json_body, headers = self._sign_body(body)
+        
+        try:
+            if method == 'GET':
+                response = await self._get_http().get(url, headers=headers)
+            elif method == 'POST':
+                response = await self._get_http().post(url, content=json_body, headers=headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            response.raise_for_status()
+            return response.json()
+        
+        except httpx.HTTPError as e:
+            logger.error(f"API request failed: {e}")
+            raise
+    
+    def warm_up_sync(self):
+        """Open a pooled HTTP session connection ahead of time (best effort, result discarded)"""
+        try:
+            self.session.head(self.base_url, timeout=5)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+    
+    async def warm_up(self):
+        """Open a pooled async connection ahead of time (best effort, result discarded)"""
+        try:
+            await self._get_http().head(self.base_url)
+        except httpx.HTTPError as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+    
+    async def aclose(self):
+        """Close the pooled async HTTP client"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     # ============= Public Market Data Methods =============
     
     def get_active_instruments(self) -> List[str]:
         """Get list of active futures instruments"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/active_instruments"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
     
     def get_instrument_details(self, pair: str) -> dict:
         """Get details for a specific instrument"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/instrument?pair={pair}"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
     
     def get_orderbook(self, pair: str, depth: int = 50) -> dict:
@@ -179,13 +277,13 @@ class CoinDCXFutures:
             depth: Orderbook depth (10, 20, or 50)
         """
         url = f"https://public.coindcx.com/market_data/v3/orderbook/{pair}-futures/{depth}"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
     
     def get_trades(self, pair: str) -> List[dict]:
         """Get recent trades for an instrument"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/trades?pair={pair}"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
     
     def get_candlesticks(self, pair: str, resolution: str, from_time: int, to_time: int) -> dict:
@@ -206,7 +304,7 @@ class CoinDCXFutures:
             "resolution": resolution,
             "pcode": "f"
         }
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         return response.json()
     
     # ============= Order Management Methods =============
@@ -266,7 +364,7 @@ class CoinDCXFutures:
         }
         
         # Add price for limit orders
-        if order_type in ["limit_order", "stop_limit", "take_profit_limit"]:
+        if order_type in PRICED_ORDER_TYPES:
             if price is None:
                 raise ValueError(f"Price is required for {order_type}")
             body["order"]["price"] = str(price)
@@ -282,6 +380,13 @@ class CoinDCXFutures:
         logger.info(f"Order cancelled: {order_id}")
         return result
     
+    async def cancel_order_async(self, order_id: str) -> dict:
+        """Cancel a specific order without blocking the event loop (pooled async HTTP)"""
+        body = {"id": order_id}
+        result = await self._make_request_async('POST', '/exchange/v1/derivatives/futures/orders/cancel', body)
+        logger.info(f"Order cancelled: {order_id}")
+        return result
+    
     def cancel_all_orders(self) -> dict:
         """Cancel all open orders"""
         result = self._make_request('POST', '/exchange/v1/derivatives/futures/positions/cancel_all_open_orders')
@@ -481,7 +586,8 @@ class CoinDCXFutures:
             # Create AsyncClient with explicit aiohttp support
             self.sio = socketio.AsyncClient(
                 logger=False,
-                engineio_logger=False
+                engineio_logger=False,
+                json=OrjsonCodec
             )
             logger.info("🔧 [INIT] Socket.IO AsyncClient created (not connected yet)")
         return self.sio
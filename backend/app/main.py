@@ -6,6 +6,9 @@ from app.core.config import settings
 from app.api.v1.router import api_router
 from app.db.session import engine, Base
 from app.services.telegram import telegram_service
+from app.api.v1.endpoints.websocket import manager as coindcx_ws_manager
+from app.services.websocket_manager import ws_manager
+from app.services.order_service import close_exchanges
 import asyncio
 
 
@@ -42,6 +45,15 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("🛑 Shutting down Scalper Bot API...")
 
+    # Cancel in-flight order processing and close the CoinDCX stream
+    await coindcx_ws_manager.shutdown()
+
+    # Stop the app WebSocket broadcast drain task
+    await ws_manager.close()
+
+    # Close the shared exchange adapters' HTTP sessions
+    await close_exchanges()
+
     # Stop Telegram bot
     if telegram_service.application:
         print("Stopping Telegram bot...")
@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Enum a
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.db.session import Base
+from app.db.base import Base
 import uuid
 import enum
 
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Numeric, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, Numeric, DateTime, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.db.session import Base
+from app.db.base import Base
 import uuid
 import enum
 
@@ -15,6 +15,10 @@ class OrderStatus(str, enum.Enum):
     FAILED = "FAILED"
 
 
+# Orders still resting on the exchange
+ACTIVE_ORDER_STATUSES = (OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED)
+
+
 class OrderType(str, enum.Enum):
     LIMIT = "LIMIT"
     MARKET = "MARKET"
@@ -66,6 +70,17 @@ class Order(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Partial index covering only live orders, so active-order lookups stay small
+    # no matter how much FILLED/CANCELLED history accumulates
+    __table_args__ = (
+        Index(
+            "ix_orders_active",
+            "bot_id",
+            created_at.desc(),
+            postgresql_where=status.in_(ACTIVE_ORDER_STATUSES),
+        ),
+    )
+
     # Relationships
     user = relationship("User")
     bot = relationship("Bot", back_populates="orders")
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from app.models.bot import Bot, BotStatus
 from app.models.order import Order, OrderStatus
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
@@ -159,60 +160,37 @@ class AnalyticsService:
                 }
 
             # Calculate PnL for each trade (simplified - actual PnL calculated differently)
-            profitable_trades = []
-            losing_trades = []
-            all_pnls = []
+            count = len(orders)
+            filled = np.fromiter((float(o.filled_price or 0) for o in orders), dtype=np.float64, count=count)
+            prices = np.fromiter((float(o.price or 0) for o in orders), dtype=np.float64, count=count)
+            all_pnls = filled - prices
 
-            for order in orders:
-                # Simplified PnL calculation
-                pnl = float(order.filled_price or 0) - float(order.price)
-                all_pnls.append(pnl)
-
-                if pnl > 0:
-                    profitable_trades.append(pnl)
-                elif pnl < 0:
-                    losing_trades.append(abs(pnl))
+            profitable_trades = all_pnls[all_pnls > 0]
+            losing_trades = -all_pnls[all_pnls < 0]
 
             # Win rate
-            win_rate = (len(profitable_trades) / len(orders) * 100) if orders else 0
+            win_rate = len(profitable_trades) / count * 100
 
             # Profit factor (gross profit / gross loss)
-            gross_profit = sum(profitable_trades) if profitable_trades else 0
-            gross_loss = sum(losing_trades) if losing_trades else 1  # Avoid division by zero
+            gross_profit = float(profitable_trades.sum())
+            gross_loss = float(losing_trades.sum()) if len(losing_trades) else 1  # Avoid division by zero
             profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
 
             # Average trade PnL
-            avg_trade_pnl = sum(all_pnls) / len(all_pnls) if all_pnls else 0
+            avg_trade_pnl = all_pnls.mean()
 
             # Best and worst trades
-            best_trade = max(all_pnls) if all_pnls else 0
-            worst_trade = min(all_pnls) if all_pnls else 0
-
-            # Max drawdown (simplified)
-            cumulative_pnl = []
-            running_total = 0
-            for pnl in all_pnls:
-                running_total += pnl
-                cumulative_pnl.append(running_total)
-
-            max_drawdown = 0
-            if cumulative_pnl:
-                peak = cumulative_pnl[0]
-                for value in cumulative_pnl:
-                    if value > peak:
-                        peak = value
-                    drawdown = peak - value
-                    if drawdown > max_drawdown:
-                        max_drawdown = drawdown
+            best_trade = all_pnls.max()
+            worst_trade = all_pnls.min()
+
+            # Max drawdown (simplified) - largest drop from the running peak
+            cumulative_pnl = np.cumsum(all_pnls)
+            max_drawdown = max(float((np.maximum.accumulate(cumulative_pnl) - cumulative_pnl).max()), 0.0)
 
             # Sharpe ratio (simplified - would need risk-free rate in production)
-            if all_pnls:
-                import statistics
-                mean_return = statistics.mean(all_pnls)
-                std_dev = statistics.stdev(all_pnls) if len(all_pnls) > 1 else 1
-                sharpe_ratio = (mean_return / std_dev) if std_dev > 0 else 0
-            else:
-                sharpe_ratio = 0
+            mean_return = float(avg_trade_pnl)
+            std_dev = float(all_pnls.std(ddof=1)) if count > 1 else 1
+            sharpe_ratio = (mean_return / std_dev) if std_dev > 0 else 0
 
             return {
                 "winRate": round(win_rate, 2),
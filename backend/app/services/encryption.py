@@ -1,49 +1,134 @@
 """
-Encryption service for API keys using Fernet symmetric encryption
+Encryption service for API keys using AES-256-GCM authenticated encryption
 Provides secure encryption and decryption of sensitive credentials
+
+Tokens are b"v2:" + urlsafe_base64(nonce || ciphertext || tag). Legacy Fernet
+tokens (written before the switch to AES-GCM) are still decrypted.
 """
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
+from functools import lru_cache
 import base64
+import hashlib
+import logging
 import os
-from typing import Tuple
+from typing import List, Tuple, Union
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
 
-class EncryptionService:
+# Fixed salt for key derivation (in production, consider per-user salts)
+_KDF_SALT = b'scalper_bot_encryption_salt_v1'
+
+# Version prefix for AES-GCM tokens; anything else is treated as legacy Fernet
+_V2_PREFIX = b'v2:'
+_NONCE_SIZE = 12
+
+# Fernet tokens start with version byte 0x80, which base64-encodes to "gAAAAA"
+_FERNET_PREFIX = b'gAAAAA'
+_MIN_PREFIX_LEN = min(len(_V2_PREFIX), len(_FERNET_PREFIX))
+
+# Token prefix keyed by its first element: an int for bytes values, a str for
+# str values (tokens are ASCII, so str values never need encoding to check)
+_PREFIX_BY_FIRST = {}
+for _prefix in (_V2_PREFIX, _FERNET_PREFIX):
+    _PREFIX_BY_FIRST[_prefix[0]] = _prefix
+    _PREFIX_BY_FIRST[chr(_prefix[0])] = _prefix.decode('ascii')
+del _prefix
+
+
+def _log_crypto_backend() -> None:
     """
-    Handles encryption and decryption of API keys
-    Uses Fernet (symmetric encryption) based on SECRET_KEY
+    Log which OpenSSL build backs hashing and key derivation
+
+    OpenSSL picks SHA-NI / AES-NI code paths at runtime from CPUID, so
+    hardware acceleration only depends on running OpenSSL >= 1.1.1. A
+    "builtin" hashlib means the interpreter was built without OpenSSL.
     """
+    logger.info(
+        f"Encryption backend: {default_backend().openssl_version_text()}, "
+        f"hashlib sha256: {'OpenSSL' if hashlib.sha256.__name__ == 'openssl_sha256' else 'builtin'}"
+    )
 
-    def __init__(self):
-        """Initialize encryption service with derived key from SECRET_KEY"""
-        self._fernet = self._create_fernet_key()
 
-    def _create_fernet_key(self) -> Fernet:
-        """
-        Create Fernet cipher from SECRET_KEY using PBKDF2 key derivation
+_log_crypto_backend()
 
-        Returns:
-            Fernet cipher instance
-        """
-        # Use a fixed salt (in production, consider per-user salts)
-        salt = b'scalper_bot_encryption_salt_v1'
 
-        # Derive a key from SECRET_KEY
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
+@lru_cache(maxsize=4)
+def _get_encryption_key(secret_key: str) -> bytes:
+    """
+    Derive the 32-byte encryption key for a SECRET_KEY using PBKDF2 (100k iterations)
+
+    Cached per secret: the derivation is deliberately slow, and SECRET_KEY
+    does not change at runtime.
+
+    Args:
+        secret_key: Secret key to derive from
+
+    Returns:
+        Raw 32-byte key
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=_KDF_SALT,
+        iterations=100000,
+        backend=default_backend()
+    )
+    return kdf.derive(secret_key.encode())
+
+
+@lru_cache(maxsize=4)
+def _get_aesgcm(secret_key: str) -> AESGCM:
+    """
+    Get the (cached) AES-256-GCM cipher for a SECRET_KEY
+
+    Call _get_aesgcm.cache_clear(), _get_fernet.cache_clear() and
+    _get_encryption_key.cache_clear() if SECRET_KEY is ever rotated in-process.
+    """
+    return AESGCM(_get_encryption_key(secret_key))
 
-        key = base64.urlsafe_b64encode(kdf.derive(settings.SECRET_KEY.encode()))
-        return Fernet(key)
+
+@lru_cache(maxsize=4)
+def _get_fernet(secret_key: str) -> Fernet:
+    """Get the (cached) Fernet cipher for a SECRET_KEY - only used to read legacy tokens"""
+    return Fernet(base64.urlsafe_b64encode(_get_encryption_key(secret_key)))
+
+
+def _encrypt(aesgcm: AESGCM, plaintext: bytes) -> bytes:
+    """Encrypt bytes into a v2 AES-GCM token"""
+    nonce = os.urandom(_NONCE_SIZE)
+    ciphertext = aesgcm.encrypt(nonce, plaintext, None)
+    return _V2_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext)
+
+
+def _decrypt(aesgcm: AESGCM, secret_key: str, token: Union[str, bytes]) -> bytes:
+    """Decrypt a v2 AES-GCM token, falling back to Fernet for legacy tokens"""
+    if isinstance(token, str):
+        # Tokens are url-safe base64 (ASCII), e.g. when read back from a text column
+        token = token.encode('ascii')
+    if token.startswith(_V2_PREFIX):
+        raw = base64.urlsafe_b64decode(token[len(_V2_PREFIX):])
+        return aesgcm.decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], None)
+    return _get_fernet(secret_key).decrypt(token)
+
+
+class EncryptionService:
+    """
+    Handles encryption and decryption of API keys
+    Uses AES-256-GCM with a key derived from SECRET_KEY
+    """
+
+    def __init__(self):
+        """Initialize encryption service with derived key from SECRET_KEY"""
+        self._secret_key = settings.SECRET_KEY
+        # Derive the key up front (so the first request doesn't pay for PBKDF2)
+        # and keep the cipher itself, so calls skip the cache lookup
+        self._aesgcm = _get_aesgcm(self._secret_key)
 
     def encrypt_credentials(self, api_key: str, api_secret: str) -> Tuple[bytes, bytes]:
         """
@@ -56,8 +141,8 @@ class EncryptionService:
         Returns:
             Tuple of (encrypted_key, encrypted_secret) as bytes
         """
-        encrypted_key = self._fernet.encrypt(api_key.encode())
-        encrypted_secret = self._fernet.encrypt(api_secret.encode())
+        encrypted_key = _encrypt(self._aesgcm, api_key.encode())
+        encrypted_secret = _encrypt(self._aesgcm, api_secret.encode())
 
         return encrypted_key, encrypted_secret
 
@@ -76,8 +161,8 @@ class EncryptionService:
             ValueError: If decryption fails (invalid key or corrupted data)
         """
         try:
-            api_key = self._fernet.decrypt(encrypted_key).decode()
-            api_secret = self._fernet.decrypt(encrypted_secret).decode()
+            api_key = _decrypt(self._aesgcm, self._secret_key, encrypted_key).decode()
+            api_secret = _decrypt(self._aesgcm, self._secret_key, encrypted_secret).decode()
             return api_key, api_secret
         except Exception as e:
             raise ValueError(f"Failed to decrypt credentials: {str(e)}")
@@ -92,7 +177,7 @@ class EncryptionService:
         Returns:
             Encrypted value as bytes
         """
-        return self._fernet.encrypt(value.encode())
+        return _encrypt(self._aesgcm, value.encode())
 
     def decrypt_string(self, encrypted_value: bytes) -> str:
         """
@@ -108,51 +193,62 @@ class EncryptionService:
             ValueError: If decryption fails
         """
         try:
-            return self._fernet.decrypt(encrypted_value).decode()
+            return _decrypt(self._aesgcm, self._secret_key, encrypted_value).decode()
         except Exception as e:
             raise ValueError(f"Failed to decrypt value: {str(e)}")
 
-    def rotate_key(self, old_secret_key: str, new_secret_key: str, encrypted_data: bytes) -> bytes:
+    def encrypt_strings(self, values: List[str]) -> List[bytes]:
         """
-        Rotate encryption key (for key rotation scenarios)
+        Encrypt many string values with the service's cipher in one pass
 
         Args:
-            old_secret_key: Previous SECRET_KEY
-            new_secret_key: New SECRET_KEY
-            encrypted_data: Data encrypted with old key
+            values: Plain text strings (empty strings stay empty)
 
         Returns:
-            Data encrypted with new key
+            Encrypted values as bytes, in input order
         """
-        # Create old Fernet instance
-        old_fernet = self._create_fernet_from_key(old_secret_key)
+        aesgcm = self._aesgcm
+        return [_encrypt(aesgcm, value.encode()) if value else b"" for value in values]
 
-        # Decrypt with old key
-        plain_text = old_fernet.decrypt(encrypted_data).decode()
+    def decrypt_strings(self, encrypted_values: List[bytes]) -> List[str]:
+        """
+        Decrypt many encrypted values with the service's cipher in one pass
 
-        # Re-encrypt with new key (current instance)
-        return self._fernet.encrypt(plain_text.encode())
+        Args:
+            encrypted_values: Encrypted bytes (empty values decrypt to "")
 
-    def _create_fernet_from_key(self, secret_key: str) -> Fernet:
+        Returns:
+            Decrypted strings, in input order
+
+        Raises:
+            ValueError: If any value fails to decrypt
+        """
+        aesgcm, secret_key = self._aesgcm, self._secret_key
+        decrypted = []
+        try:
+            for token in encrypted_values:
+                decrypted.append(_decrypt(aesgcm, secret_key, token).decode() if token else "")
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt value {len(decrypted)}: {str(e)}")
+        return decrypted
+
+    def rotate_key(self, old_secret_key: str, new_secret_key: str, encrypted_data: bytes) -> bytes:
         """
-        Create Fernet instance from a specific secret key
+        Rotate encryption key (for key rotation scenarios)
 
         Args:
-            secret_key: Secret key to use
+            old_secret_key: Previous SECRET_KEY
+            new_secret_key: New SECRET_KEY
+            encrypted_data: Data encrypted with old key
 
         Returns:
-            Fernet instance
+            Data encrypted with new key
         """
-        salt = b'scalper_bot_encryption_salt_v1'
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
-        return Fernet(key)
+        # Decrypt with old key (v2 or legacy Fernet token)
+        plain_text = _decrypt(_get_aesgcm(old_secret_key), old_secret_key, encrypted_data)
+
+        # Re-encrypt with new key
+        return _encrypt(_get_aesgcm(new_secret_key), plain_text)
 
 
 # Global encryption service instance
@@ -186,3 +282,62 @@ def decrypt_api_credentials(encrypted_key: bytes, encrypted_secret: bytes) -> Tu
         Tuple of (api_key, api_secret) as plain text
     """
     return encryption_service.decrypt_credentials(encrypted_key, encrypted_secret)
+
+
+def encrypt_api_keys_bulk(keys: List[str]) -> List[bytes]:
+    """
+    Encrypt a batch of API keys/secrets (e.g. when loading many bots at once)
+
+    Args:
+        keys: Plain text values
+
+    Returns:
+        Encrypted values, in input order
+    """
+    return encryption_service.encrypt_strings(keys)
+
+
+def decrypt_api_keys_bulk(keys: List[bytes]) -> List[str]:
+    """
+    Decrypt a batch of API keys/secrets (e.g. when loading many bots at once)
+
+    Args:
+        keys: Encrypted values
+
+    Returns:
+        Plain text values, in input order
+    """
+    return encryption_service.decrypt_strings(keys)
+
+
+def is_encrypted(value: Union[str, bytes]) -> bool:
+    """
+    Check whether a value looks like a token produced by this module
+
+    Only inspects the prefix (v2 AES-GCM or legacy Fernet); it does not
+    verify the token. Checking the first character rejects most plain
+    values before the prefix comparison.
+
+    Args:
+        value: Stored value (str or bytes)
+
+    Returns:
+        True if the value carries an encryption token prefix
+    """
+    if len(value) < _MIN_PREFIX_LEN:
+        return False
+    prefix = _PREFIX_BY_FIRST.get(value[0])
+    return prefix is not None and value.startswith(prefix)
+
+
+def is_encrypted_many(values: List[Union[str, bytes]]) -> List[bool]:
+    """
+    Check a batch of values with is_encrypted
+
+    Args:
+        values: Stored values
+
+    Returns:
+        One flag per value, in input order
+    """
+    return [is_encrypted(value) for value in values]
@@ -11,7 +11,6 @@ This service monitors order status changes (via WebSocket events) and:
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from datetime import datetime
 import logging
 import asyncio
@@ -24,7 +23,9 @@ from app.models.bot import ActivityLog
 from app.services.order_service import (
     place_order_for_bot,
     get_order_by_exchange_id,
-    update_order_status
+    update_order_status,
+    GET_ORDER_BY_ID,
+    GET_BOT_BY_ID
 )
 from app.services.telegram import telegram_service
 
@@ -93,7 +94,7 @@ async def process_order_fill(
             )
 
             # Get the bot
-            result = await db.execute(select(Bot).where(Bot.id == order.bot_id))
+            result = await db.execute(GET_BOT_BY_ID, {"bot_id": order.bot_id})
             bot = result.scalar_one_or_none()
             if not bot:
                 logger.error(f"Bot {order.bot_id} not found for order {order.id}")
@@ -235,9 +236,7 @@ async def complete_trading_cycle(
             logger.warning(f"Sell order {sell_order.id} has no paired buy order")
             return
 
-        result = await db.execute(
-            select(Order).where(Order.id == sell_order.paired_order_id)
-        )
+        result = await db.execute(GET_ORDER_BY_ID, {"order_id": sell_order.paired_order_id})
         buy_order = result.scalar_one_or_none()
 
         if not buy_order:
@@ -8,21 +8,32 @@ This service provides a unified interface for placing orders, whether for:
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, bindparam
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from app.models.bot import Bot, BotStatus
 from app.models.order import Order, OrderStatus, OrderType as DBOrderType
 from app.models.bot import OrderSide as BotOrderSide, Exchange as BotExchange
 from app.exchanges.base import OrderRequest, OrderSide, OrderType
-from app.exchanges import ExchangeFactory
+from app.exchanges import BaseExchange, ExchangeFactory
 
 logger = logging.getLogger(__name__)
 
+# Hot lookups built once at import time; values are bound per execute() call
+GET_ORDER_BY_ID = select(Order).where(Order.id == bindparam("order_id"))
+GET_ORDER_BY_EXCHANGE_ID = select(Order).where(Order.exchange_order_id == bindparam("exchange_order_id"))
+GET_BOT_ID_BY_EXCHANGE_ORDER_ID = select(Order.bot_id).where(Order.exchange_order_id == bindparam("exchange_order_id"))
+GET_BOT_BY_ID = select(Bot).where(Bot.id == bindparam("bot_id"))
 
-def get_exchange_for_bot(bot: Bot):
-    """Get the appropriate exchange adapter for a bot"""
+
+# Exchange adapters by exchange name. Credentials come from the exchange config,
+# so one adapter (and its HTTP sessions) per exchange is shared by all bots
+_exchanges: Dict[str, BaseExchange] = {}
+
+
+def get_exchange_for_bot(bot: Bot) -> BaseExchange:
+    """Get the (shared) exchange adapter for a bot"""
     exchange_map = {
         BotExchange.COINDCX_F: "coindcx",
         BotExchange.BINANCE: "binance"
@@ -32,7 +43,21 @@ def get_exchange_for_bot(bot: Bot):
     if not exchange_name:
         raise ValueError(f"Unsupported exchange: {bot.exchange}")
 
-    return ExchangeFactory.create_sync(exchange_name)
+    exchange = _exchanges.get(exchange_name)
+    if exchange is None:
+        exchange = _exchanges[exchange_name] = ExchangeFactory.create_sync(exchange_name)
+    return exchange
+
+
+async def close_exchanges() -> None:
+    """Close the shared exchange adapters (called on shutdown)"""
+    exchanges = list(_exchanges.values())
+    _exchanges.clear()
+    for exchange in exchanges:
+        try:
+            await exchange.close()
+        except Exception as e:
+            logger.error(f"Failed to close {exchange}: {e}")
 
 
 async def place_order_for_bot(
@@ -58,7 +83,8 @@ async def place_order_for_bot(
         The created Order database record
 
     Raises:
-        Exception: If order placement fails
+        Exception: If order placement fails. When the exchange call itself
+            raises, a FAILED order row is recorded before re-raising.
     """
     try:
         # Get exchange adapter
@@ -89,26 +115,50 @@ async def place_order_for_bot(
             f"{bot.ticker} @ ${price} with {leverage}x leverage"
         )
 
-        # Place order on exchange
-        order_response = await exchange.place_order(order_request)
-
-        # Create order record in database
-        db_order = Order(
+        order_values = dict(
+            user_id=bot.user_id,
             bot_id=bot.id,
-            exchange_order_id=order_response.order_id,
             symbol=bot.ticker,
             side=side,
             order_type=DBOrderType.LIMIT,
             quantity=bot.quantity,
             price=price,
-            status=OrderStatus.PENDING,
-            filled_quantity=float(order_response.filled_quantity),
-            filled_price=float(order_response.average_price) if order_response.average_price else None,
             commission=0.0,
             paired_order_id=paired_order_id
         )
-        db.add(db_order)
-        await db.flush()  # Get the ID without committing
+
+        # Place order on exchange BEFORE touching the database, so the row is
+        # written once with the exchange response already merged in
+        try:
+            order_response = await exchange.place_order(order_request)
+        except Exception:
+            # Exchange rejected/failed the order - keep an audit record of the attempt.
+            # The insert runs in a SAVEPOINT so that if it fails too, only it is rolled
+            # back: the session stays usable for the caller's error handling, and the
+            # exchange error (not the audit one) is what propagates
+            try:
+                async with db.begin_nested():
+                    await db.execute(
+                        insert(Order).values(**order_values, status=OrderStatus.FAILED, filled_quantity=0)
+                    )
+            except Exception as audit_error:
+                logger.error(f"Failed to record FAILED order for bot {bot.id}: {audit_error}")
+            raise
+
+        # Single round trip: INSERT ... RETURNING gives back the persistent Order,
+        # including server-side defaults (created_at/updated_at)
+        result = await db.execute(
+            insert(Order)
+            .values(
+                **order_values,
+                exchange_order_id=order_response.order_id,
+                status=OrderStatus.PENDING,
+                filled_quantity=float(order_response.filled_quantity),
+                filled_price=float(order_response.average_price) if order_response.average_price else None
+            )
+            .returning(Order)
+        )
+        db_order = result.scalar_one()
 
         logger.info(
             f"Order {db_order.id} created successfully. "
@@ -133,9 +183,7 @@ async def get_order_by_exchange_id(exchange_order_id: str, db: AsyncSession) ->
     Returns:
         Order if found, None otherwise
     """
-    result = await db.execute(
-        select(Order).where(Order.exchange_order_id == exchange_order_id)
-    )
+    result = await db.execute(GET_ORDER_BY_EXCHANGE_ID, {"exchange_order_id": exchange_order_id})
     return result.scalar_one_or_none()
 
 
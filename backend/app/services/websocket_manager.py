@@ -1,14 +1,18 @@
 """
 WebSocket Connection Manager for broadcasting application events
 """
-from typing import Dict, Set, Any
+from typing import Dict, Set, Any, Optional
 from fastapi import WebSocket
-import json
+import asyncio
+import orjson
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Max queued broadcasts before the oldest ones are dropped
+OUTBOX_MAXSIZE = 10000
+
 
 class WebSocketManager:
     """
@@ -18,6 +22,11 @@ class WebSocketManager:
     def __init__(self):
         # Set of active WebSocket connections
         self.active_connections: Set[WebSocket] = set()
+
+        # Broadcasts are queued here and sent by a dedicated drain task, so callers
+        # (e.g. order handling) never wait on slow WebSocket clients
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_MAXSIZE)
+        self._drain_task: Optional[asyncio.Task] = None
         logger.info("[WS Manager] Initialized")
 
     async def connect(self, websocket: WebSocket):
@@ -41,14 +50,17 @@ class WebSocketManager:
     async def send_personal_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send a message to a specific client"""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
             logger.error(f"[WS Manager] Error sending personal message: {e}")
             self.disconnect(websocket)
 
     async def broadcast(self, message_type: str, data: Any):
         """
-        Broadcast a message to all connected clients
+        Queue a message for broadcast to all connected clients
+
+        Returns immediately; the drain task performs the actual sends. When the
+        outbox is full the oldest queued message is dropped.
 
         Args:
             message_type: Type of message (bot_update, order_filled, etc.)
@@ -64,20 +76,58 @@ class WebSocketManager:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-        logger.info(f"[WS Manager] Broadcasting {message_type} to {len(self.active_connections)} clients")
+        self._ensure_drain_task()
 
-        # Send to all connections, removing dead ones
-        dead_connections = set()
-        for connection in self.active_connections:
+        try:
+            self._outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            dropped = self._outbox.get_nowait()
+            logger.warning(f"[WS Manager] Outbox full, dropping oldest {dropped['type']} message")
+            self._outbox.put_nowait(message)
+
+    def _ensure_drain_task(self):
+        """Start the drain task on first use (the global instance is created before the loop runs)"""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_loop())
+
+    async def _drain_loop(self):
+        """Pop queued messages and fan them out to every connected client"""
+        while True:
+            message = await self._outbox.get()
             try:
-                await connection.send_text(json.dumps(message))
+                await self._send_to_all(message)
             except Exception as e:
-                logger.error(f"[WS Manager] Error broadcasting to client: {e}")
-                dead_connections.add(connection)
+                logger.error(f"[WS Manager] Error draining {message['type']} broadcast: {e}")
+
+    async def _send_to_all(self, message: Dict[str, Any]):
+        """Send one message to all connected clients, removing dead ones"""
+        if not self.active_connections:
+            return
 
-        # Clean up dead connections
-        for connection in dead_connections:
-            self.disconnect(connection)
+        logger.info(f"[WS Manager] Broadcasting {message['type']} to {len(self.active_connections)} clients")
+
+        # Every client receives the same frame, so encode once and share the text.
+        # The frontend parses text frames (JSON.parse on event.data), so stay on send_text.
+        payload = orjson.dumps(message).decode()
+
+        # Send to all connections concurrently, removing dead ones
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"[WS Manager] Error broadcasting to client: {result}")
+                self.disconnect(connection)
+
+    async def close(self):
+        """Stop the drain task (pending broadcasts are discarded)"""
+        if self._drain_task and not self._drain_task.done():
+            self._drain_task.cancel()
+            await asyncio.gather(self._drain_task, return_exceptions=True)
+        self._drain_task = None
 
     async def broadcast_bot_update(self, bot_id: str, bot_data: Dict[str, Any]):
         """Broadcast bot update event"""
@@ -3,20 +3,22 @@
 Script to create the orders table in the database
 Run this if the orders table doesn't exist
 """
-import asyncio
-from app.db.session import engine, Base
+from sqlalchemy import create_engine
+from app.core.config import settings
+from app.db.base import Base
 from app.models.order import Order
 from app.models.bot import Bot
 
-async def create_tables():
+def create_tables():
     """Create all tables defined in the models"""
     print("Creating orders table...")
 
-    async with engine.begin() as conn:
+    engine = create_engine(settings.SYNC_DATABASE_URL)
+    with engine.begin() as conn:
         # Create all tables (only creates if they don't exist)
-        await conn.run_sync(Base.metadata.create_all)
+        Base.metadata.create_all(conn)
 
     print("✅ Orders table created successfully!")
 
 if __name__ == '__main__':
-    asyncio.run(create_tables())
+    create_tables()
@@ -3,10 +3,10 @@
 Force Recreate Database Script - Terminates all connections first
 
 This script will:
-1. TERMINATE all connections to scalper_bot database
-2. DROP the database
-3. CREATE fresh database
-4. CREATE all tables with latest schema
+1. TERMINATE all connections to scalper_bot database and DROP it
+   (DROP DATABASE ... WITH (FORCE), PostgreSQL 13+)
+2. CREATE fresh database
+3. CREATE all tables with latest schema
 
 IMPORTANT: Stop the backend server first if it's running!
 
@@ -15,20 +15,24 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.schema import VERIFY_SCHEMA_SQL, create_schema
+from app.models.bot import Base
+from script_output import write_banner
+
 
 async def force_recreate_database():
     """Force drop and recreate the database by terminating connections"""
 
-    print()
-    print("=" * 80)
-    print("  FORCE DATABASE RECREATION - Terminates all connections!")
-    print("=" * 80)
-    print()
+    write_banner("FORCE DATABASE RECREATION - Terminates all connections!")
     print("⚠️  IMPORTANT: Make sure to stop the backend server first!")
     print("   (Press Ctrl+C in the terminal running uvicorn)")
     print()
@@ -43,11 +47,6 @@ async def force_recreate_database():
     print()
 
     try:
-        from sqlalchemy.ext.asyncio import create_async_engine
-        from sqlalchemy import text
-        from app.models.bot import Base
-        import os
-
         db_user = os.getenv("USER", "anujsainicse")
         postgres_url = f"postgresql+asyncpg://{db_user}@localhost:5432/postgres"
 
@@ -56,31 +55,20 @@ async def force_recreate_database():
         admin_engine = create_async_engine(postgres_url, isolation_level="AUTOCOMMIT")
 
         async with admin_engine.connect() as conn:
-            # Terminate all connections to scalper_bot
-            print("🔌 Step 2: Terminating all connections to 'scalper_bot' database...")
+            # Terminate connections and drop in one statement. WITH (FORCE)
+            # (PostgreSQL 13+) does both server-side, so no client can reconnect
+            # in between. DROP DATABASE can't run inside a DO block or a
+            # multi-statement transaction, so this is as far as it can be fused.
+            print("🗑️  Step 2: Terminating connections and dropping 'scalper_bot' database...")
             try:
-                result = await conn.execute(text("""
-                    SELECT pg_terminate_backend(pg_stat_activity.pid)
-                    FROM pg_stat_activity
-                    WHERE pg_stat_activity.datname = 'scalper_bot'
-                    AND pid <> pg_backend_pid();
-                """))
-                terminated = len(result.fetchall())
-                print(f"   ✅ Terminated {terminated} connection(s)")
-            except Exception as e:
-                print(f"   ⚠️  Warning: {e}")
-
-            # Drop database
-            print("🗑️  Step 3: Dropping 'scalper_bot' database...")
-            try:
-                await conn.execute(text("DROP DATABASE IF EXISTS scalper_bot;"))
+                await conn.execute(text("DROP DATABASE IF EXISTS scalper_bot WITH (FORCE);"))
                 print("   ✅ Database dropped successfully")
             except Exception as e:
                 print(f"   ❌ Failed to drop: {e}")
                 return False
 
             # Create database
-            print("🏗️  Step 4: Creating new 'scalper_bot' database...")
+            print("🏗️  Step 3: Creating new 'scalper_bot' database...")
             await conn.execute(text("CREATE DATABASE scalper_bot;"))
             print("   ✅ Database created successfully")
 
@@ -88,44 +76,35 @@ async def force_recreate_database():
         print()
 
         # Create tables
-        print("📍 Step 5: Connecting to new 'scalper_bot' database...")
+        print("📍 Step 4: Connecting to new 'scalper_bot' database...")
         app_url = f"postgresql+asyncpg://{db_user}@localhost:5432/scalper_bot"
         app_engine = create_async_engine(app_url)
 
-        print("🏗️  Step 6: Creating all tables with latest schema...")
+        print("🏗️  Step 5: Creating all tables with latest schema...")
         async with app_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            # The database was just created: send the whole schema as one DDL batch
+            await create_schema(conn, Base.metadata)
         print("   ✅ All tables created")
         print()
 
         # Verify
-        print("✅ Step 7: Verifying setup...")
+        print("✅ Step 6: Verifying setup...")
         async with app_engine.connect() as conn:
-            # Check tables
-            result = await conn.execute(text("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_schema = 'public' ORDER BY table_name;
-            """))
-            tables = [row[0] for row in result.fetchall()]
-            print(f"   📋 Tables: {', '.join(tables)}")
-
-            # Check cancellation_reason column
-            result = await conn.execute(text("""
-                SELECT column_name FROM information_schema.columns
-                WHERE table_name = 'orders' AND column_name = 'cancellation_reason';
-            """))
-            if result.fetchone():
-                print("   ✅ cancellation_reason column EXISTS")
-            else:
-                print("   ❌ cancellation_reason column NOT FOUND!")
+            result = await conn.execute(text(VERIFY_SCHEMA_SQL))
+            rows = result.fetchall()
+
+        tables = [row.table_name for row in rows if row.kind == "table"]
+        order_columns = {row.column_name for row in rows if row.kind == "column"}
+
+        print(f"   📋 Tables: {', '.join(tables)}")
+        if "cancellation_reason" in order_columns:
+            print("   ✅ cancellation_reason column EXISTS")
+        else:
+            print("   ❌ cancellation_reason column NOT FOUND!")
 
         await app_engine.dispose()
 
-        print()
-        print("=" * 80)
-        print("  ✅ SUCCESS! Database recreated with latest schema")
-        print("=" * 80)
-        print()
+        write_banner("✅ SUCCESS! Database recreated with latest schema")
         print("🚀 Next steps:")
         print("   1. Start backend: uvicorn app.main:app --reload")
         print("   2. All tables include the latest schema with cancellation_reason")
@@ -134,11 +113,8 @@ async def force_recreate_database():
         return True
 
     except Exception as e:
-        print()
-        print("=" * 80)
-        print("  ❌ FAILED!")
-        print("=" * 80)
-        print(f"\nError: {e}\n")
+        write_banner("❌ FAILED!")
+        print(f"Error: {e}\n")
         import traceback
         traceback.print_exc()
         return False
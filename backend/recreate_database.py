@@ -15,21 +15,25 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.schema import VERIFY_SCHEMA_SQL, create_schema
+from app.models.bot import Base  # This imports all models
+from script_output import write_banner
+
 
 async def recreate_database():
     """Drop and recreate the database with all tables"""
 
-    print()
-    print("=" * 80)
-    print("  DATABASE RECREATION - This will DELETE ALL DATA!")
-    print("=" * 80)
-    print()
+    write_banner("DATABASE RECREATION - This will DELETE ALL DATA!")
 
     # Get confirmation
     response = input("Are you sure you want to DROP the scalper_bot database? (yes/no): ")
@@ -42,15 +46,9 @@ async def recreate_database():
     print()
 
     try:
-        # Import after confirmation to avoid loading models unnecessarily
-        from sqlalchemy.ext.asyncio import create_async_engine
-        from sqlalchemy import text
-        from app.models.bot import Base  # This imports all models
-
         # Step 1: Connect to postgres database (not scalper_bot) to drop/create
         print("📍 Step 1: Connecting to PostgreSQL server...")
         # Use current system user for macOS PostgreSQL default setup
-        import os
         db_user = os.getenv("USER", "postgres")
         postgres_url = f"postgresql+asyncpg://{db_user}@localhost:5432/postgres"
         print(f"   Using database user: {db_user}")
@@ -80,61 +78,48 @@ async def recreate_database():
 
         print("🏗️  Step 5: Creating all tables with latest schema...")
         async with app_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            # Fresh database - send the whole schema as one DDL batch
+            await create_schema(conn, Base.metadata)
         print("   ✅ All tables created successfully")
         print()
 
         # Step 3: Verify tables
         print("✅ Step 6: Verifying table creation...")
         async with app_engine.connect() as conn:
-            # Check tables exist
-            result = await conn.execute(text("""
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'public'
-                ORDER BY table_name;
-            """))
-            tables = [row[0] for row in result.fetchall()]
-
-            print(f"   📋 Tables created: {', '.join(tables)}")
-
-            expected_tables = ['bots', 'orders', 'activity_logs', 'telegram_connections']
-            missing = [t for t in expected_tables if t not in tables]
-            if missing:
-                print(f"   ⚠️  Warning: Missing tables: {', '.join(missing)}")
-
-            # Verify cancellation_reason column exists
-            result = await conn.execute(text("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = 'orders' AND column_name = 'cancellation_reason';
-            """))
-            if result.fetchone():
-                print("   ✅ cancellation_reason column exists in orders table")
-            else:
-                print("   ❌ ERROR: cancellation_reason column NOT found!")
-                return False
-
-            # Show orders table structure
-            print()
-            print("📋 Orders table structure:")
-            result = await conn.execute(text("""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = 'orders'
-                ORDER BY ordinal_position;
-            """))
-            for row in result.fetchall():
-                nullable = "NULL" if row[2] == "YES" else "NOT NULL"
-                print(f"   - {row[0]:<25} {row[1]:<20} {nullable}")
+            # Tables, the cancellation_reason check and the orders structure all
+            # come from one catalog query
+            result = await conn.execute(text(VERIFY_SCHEMA_SQL))
+            rows = result.fetchall()
+
+        tables = [row.table_name for row in rows if row.kind == "table"]
+        order_columns = [row for row in rows if row.kind == "column"]
+
+        print(f"   📋 Tables created: {', '.join(tables)}")
+
+        expected_tables = ['bots', 'orders', 'activity_logs', 'telegram_connections']
+        missing = [t for t in expected_tables if t not in tables]
+        if missing:
+            print(f"   ⚠️  Warning: Missing tables: {', '.join(missing)}")
+
+        # Verify cancellation_reason column exists
+        if any(row.column_name == "cancellation_reason" for row in order_columns):
+            print("   ✅ cancellation_reason column exists in orders table")
+        else:
+            print("   ❌ ERROR: cancellation_reason column NOT found!")
+            await app_engine.dispose()
+            return False
+
+        # Show orders table structure
+        print()
+        print("📋 Orders table structure:")
+        sys.stdout.write("".join(
+            f"   - {row.column_name:<25} {row.data_type:<20} {'NULL' if row.is_nullable == 'YES' else 'NOT NULL'}\n"
+            for row in order_columns
+        ))
 
         await app_engine.dispose()
 
-        print()
-        print("=" * 80)
-        print("  ✅ DATABASE RECREATION COMPLETED SUCCESSFULLY!")
-        print("=" * 80)
-        print()
+        write_banner("✅ DATABASE RECREATION COMPLETED SUCCESSFULLY!")
         print("📝 Summary:")
         print("   - Old database: DROPPED")
         print("   - New database: CREATED")
@@ -148,11 +133,7 @@ async def recreate_database():
         return True
 
     except Exception as e:
-        print()
-        print("=" * 80)
-        print("  ❌ DATABASE RECREATION FAILED!")
-        print("=" * 80)
-        print()
+        write_banner("❌ DATABASE RECREATION FAILED!")
         print(f"Error: {type(e).__name__}: {e}")
         print()
         print("💡 Troubleshooting:")
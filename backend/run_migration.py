@@ -8,25 +8,25 @@ Usage:
     python run_migration.py
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.db.session import AsyncSessionLocal
-from sqlalchemy import text
+from app.core.config import settings
+from sqlalchemy import create_engine, text
 
 
-async def run_migration():
+def run_migration():
     """Add cancellation_reason column to orders table"""
 
     print("🔄 Running database migration...")
     print("   Adding cancellation_reason column to orders table")
 
     try:
-        async with AsyncSessionLocal() as db:
+        engine = create_engine(settings.SYNC_DATABASE_URL)
+        with engine.connect() as db:
             # Check if column already exists
             check_query = text("""
                 SELECT column_name
@@ -35,7 +35,7 @@ async def run_migration():
                 AND column_name = 'cancellation_reason';
             """)
 
-            result = await db.execute(check_query)
+            result = db.execute(check_query)
             existing = result.fetchone()
 
             if existing:
@@ -48,14 +48,14 @@ async def run_migration():
                 ADD COLUMN cancellation_reason VARCHAR(50);
             """)
 
-            await db.execute(migration_query)
-            await db.commit()
+            db.execute(migration_query)
+            db.commit()
 
             print("✅ Migration completed successfully!")
             print("   Column 'cancellation_reason' added to 'orders' table")
 
             # Verify the column was added
-            verify_result = await db.execute(check_query)
+            verify_result = db.execute(check_query)
             if verify_result.fetchone():
                 print("✅ Verification passed - column exists in database")
                 return True
@@ -84,7 +84,7 @@ def main():
     print("=" * 70)
     print()
 
-    success = asyncio.run(run_migration())
+    success = run_migration()
 
     print()
     if success:
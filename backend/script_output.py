@@ -0,0 +1,11 @@
+"""
+Console output helpers shared by the database recreation scripts
+"""
+import sys
+
+_RULE = "=" * 80
+
+
+def write_banner(title: str) -> None:
+    """Write a boxed section title with a single stdout write"""
+    sys.stdout.write(f"\n{_RULE}\n  {title}\n{_RULE}\n\n")
@@ -16,6 +16,14 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Frontend exchange names -> ExchangeFactory names (same as bot endpoint does)
+_EXCHANGE_MAP = {
+    "CoinDCX F": "coindcx",
+    "Binance": "binance",
+}
+_SIDE_BY_NAME = {"BUY": OrderSide.BUY, "SELL": OrderSide.SELL}
+_PRICE_KEY_BY_SIDE = {"BUY": "buy_price", "SELL": "sell_price"}
+
 
 async def test_bot_order_placement():
     """Test placing an order exactly like the bot endpoint does"""
@@ -42,12 +50,7 @@ async def test_bot_order_placement():
         # Step 1: Get exchange adapter (same as bot endpoint)
         print("\n[2/4] Getting exchange adapter...")
 
-        # Map exchange name (same as bot endpoint does)
-        exchange_map = {
-            "CoinDCX F": "coindcx",
-            "Binance": "binance",
-        }
-        exchange_name = exchange_map.get(bot_config["exchange"])
+        exchange_name = _EXCHANGE_MAP.get(bot_config["exchange"])
         print(f"   Exchange name: {exchange_name}")
 
         exchange = await ExchangeFactory.create(exchange_name)
@@ -55,8 +58,8 @@ async def test_bot_order_placement():
 
         # Step 2: Create order request (EXACTLY as bot endpoint does)
         print("\n[3/4] Creating order request...")
-        order_side = OrderSide.BUY if bot_config["first_order"] == "BUY" else OrderSide.SELL
-        order_price = bot_config["buy_price"] if bot_config["first_order"] == "BUY" else bot_config["sell_price"]
+        order_side = _SIDE_BY_NAME[bot_config["first_order"]]
+        order_price = bot_config[_PRICE_KEY_BY_SIDE[bot_config["first_order"]]]
 
         order_request = OrderRequest(
             symbol=bot_config["ticker"],  # "ETH/USDT"
@@ -21,10 +21,19 @@ async def test_exchange_connection():
         exchange = ExchangeFactory.create_sync("coindcx")
         print(f"   ✓ Exchange adapter created: {exchange}")
 
+        # The network checks are independent, so run them concurrently and
+        # report each result in order below
+        is_healthy, balance, current_price, open_orders = await asyncio.gather(
+            exchange.health_check(),
+            exchange.get_balance(),
+            exchange.get_current_price("ETH/USDT"),
+            exchange.get_open_orders(),
+            return_exceptions=True
+        )
+
         # 2. Test health check
         print("\n2. Testing API connection...")
-        is_healthy = await exchange.health_check()
-        if is_healthy:
+        if is_healthy is True:
             print("   ✓ API connection successful")
         else:
             print("   ✗ API connection failed")
@@ -32,7 +41,8 @@ async def test_exchange_connection():
 
         # 3. Get account balance
         print("\n3. Fetching account balance...")
-        balance = await exchange.get_balance()
+        if isinstance(balance, Exception):
+            raise balance
         print(f"   Balance: {balance}")
 
         # 4. Test symbol normalization
@@ -47,17 +57,17 @@ async def test_exchange_connection():
 
         # 5. Get current price (test ticker data access)
         print("\n5. Fetching current ETH/USDT price...")
-        try:
-            current_price = await exchange.get_current_price("ETH/USDT")
+        if isinstance(current_price, Exception):
+            print(f"   ! Price fetch failed: {current_price}")
+            print("   (This is optional - may not affect bot functionality)")
+        else:
             print(f"   Current ETH/USDT price: ${current_price:,.2f}")
             print("   ✓ Market data access works")
-        except Exception as e:
-            print(f"   ! Price fetch failed: {e}")
-            print("   (This is optional - may not affect bot functionality)")
 
         # 6. Get open orders
         print("\n6. Checking existing open orders...")
-        open_orders = await exchange.get_open_orders()
+        if isinstance(open_orders, Exception):
+            raise open_orders
         print(f"   Open orders: {len(open_orders)}")
         if open_orders:
             for order in open_orders[:3]:  # Show first 3
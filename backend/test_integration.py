@@ -4,6 +4,7 @@ Tests all core functionality without placing real orders
 """
 
 import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -11,11 +12,31 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.exchanges import ExchangeFactory, ExchangeRegistry
+from app.core.log_queue import start_queue_logging
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# Per-call limit for the concurrent probes, so one stuck endpoint can't stall the run
+PROBE_TIMEOUT = 5
+
+# Shared exchange instance (and its HTTP session) for every test step
+_exchange = None
+
+
+async def get_exchange():
+    """Create the CoinDCX exchange once and reuse it"""
+    global _exchange
+    if _exchange is None:
+        exchange = await ExchangeFactory.create("coindcx")
+        # Open a connection to the API host (DNS + TCP + TLS) so later calls reuse it
+        await asyncio.to_thread(exchange.client.warm_up_sync)
+        _exchange = exchange
+    return _exchange
+
 
 async def test_integration():
     """Test CoinDCX integration without placing orders"""
@@ -33,17 +54,23 @@ async def test_integration():
 
         # Test 2: Create exchange instance
         print("\n[TEST 2] Creating CoinDCX exchange instance...")
-        exchange = await ExchangeFactory.create("coindcx")
+        exchange = await get_exchange()
         print(f"✅ Exchange created: {exchange}")
 
+        # Tests 3-5 are independent network calls: fetch them concurrently,
+        # then report the results in order
+        current_price, position, orders = await asyncio.gather(
+            asyncio.wait_for(exchange.get_current_price("ETH/USDT"), timeout=PROBE_TIMEOUT),
+            asyncio.wait_for(exchange.get_position("ETH/USDT"), timeout=PROBE_TIMEOUT),
+            asyncio.wait_for(exchange.get_open_orders("ETH/USDT"), timeout=PROBE_TIMEOUT)
+        )
+
         # Test 3: Fetch current price
         print("\n[TEST 3] Fetching current ETH/USDT price...")
-        current_price = await exchange.get_current_price("ETH/USDT")
         print(f"✅ Current ETH price: ${current_price:,.2f}")
 
         # Test 4: Check existing position
         print("\n[TEST 4] Checking existing positions...")
-        position = await exchange.get_position("ETH/USDT")
         if position:
             print(f"✅ Position found:")
             print(f"   Size: {position.size}")
@@ -57,7 +84,6 @@ async def test_integration():
 
         # Test 5: Get open orders
         print("\n[TEST 5] Fetching open orders...")
-        orders = await exchange.get_open_orders("ETH/USDT")
         print(f"✅ Found {len(orders)} open orders")
         if orders:
             for i, order in enumerate(orders[:3], 1):  # Show max 3
@@ -89,13 +115,17 @@ async def test_integration():
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Integration test failed")
         return False
 
     return True
 
 
 if __name__ == "__main__":
-    success = asyncio.run(test_integration())
+    # Tracebacks are written by a logging thread, off the event loop
+    listener = start_queue_logging()
+    try:
+        success = asyncio.run(test_integration())
+    finally:
+        listener.stop()
     sys.exit(0 if success else 1)
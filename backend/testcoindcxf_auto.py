@@ -4,6 +4,7 @@ AUTO MODE - No confirmation required (for automated testing)
 """
 
 import asyncio
+import logging
 import sys
 import os
 from pathlib import Path
@@ -12,23 +13,49 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.exchanges import ExchangeFactory, OrderRequest, OrderSide, OrderType
+from app.core.log_queue import start_queue_logging
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# Shared exchange instance (and its HTTP session) for the whole run
+_exchange = None
+
+# show_open_orders lists at most this many orders
+MAX_ORDERS_SHOWN = 20
+
+
+async def get_exchange():
+    """Create the CoinDCX exchange once and reuse it"""
+    global _exchange
+    if _exchange is None:
+        exchange = await ExchangeFactory.create("coindcx")
+        # Open a connection to the API host (DNS + TCP + TLS) so later calls reuse it
+        await asyncio.to_thread(exchange.client.warm_up_sync)
+        _exchange = exchange
+    return _exchange
+
 
 async def test_buy_eth():
-    """Test buying 1 ETH at $3800 - AUTO MODE"""
+    """
+    Test buying 1 ETH at $3800 - AUTO MODE
+
+    Returns the task fetching open orders (started once the order is placed,
+    so it overlaps the confirmation printout), or None if placing failed.
+    """
 
     print("=" * 60)
     print("CoinDCX Futures - Buy 1 ETH at $3800 [AUTO MODE]")
     print("=" * 60)
 
+    orders_task = None
     try:
         # Step 1: Create exchange instance
         print("\n[1/5] Creating CoinDCX Futures exchange instance...")
-        exchange = await ExchangeFactory.create("coindcx")
+        exchange = await get_exchange()
         print(f"✅ Exchange created: {exchange}")
 
         # Step 2: Get current ETH price
@@ -91,6 +118,10 @@ async def test_buy_eth():
         # Step 5: Place the order
         print("\n[5/5] Placing order on CoinDCX Futures...")
         response = await exchange.place_order(order)
+        orders_task = asyncio.create_task(exchange.get_open_orders("ETH/USDT"))
+        # Let the task start (it hands the request to a worker thread) before the
+        # synchronous prints below, so the fetch overlaps them
+        await asyncio.sleep(0)
 
         print("\n" + "="*60)
         print("✅ ORDER PLACED SUCCESSFULLY!")
@@ -118,36 +149,56 @@ async def test_buy_eth():
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Test order failed")
 
+    return orders_task
 
-async def show_open_orders():
-    """Show all open orders"""
+
+async def show_open_orders(exchange=None, orders_task=None):
+    """
+    Show open orders (reuses the shared exchange unless one is given)
+
+    orders_task: an already started get_open_orders fetch to print instead
+    of fetching again
+    """
     print("\n" + "="*60)
     print("OPEN ORDERS")
     print("="*60)
 
     try:
-        exchange = await ExchangeFactory.create("coindcx")
-        orders = await exchange.get_open_orders("ETH/USDT")
+        if orders_task is not None:
+            orders = await orders_task
+        else:
+            exchange = exchange or await get_exchange()
+            orders = await exchange.get_open_orders("ETH/USDT")
 
         if not orders:
             print("No open orders for ETH/USDT")
         else:
-            for i, order in enumerate(orders, 1):
-                print(f"\n[{i}] Order ID: {order.order_id}")
-                print(f"    Symbol: {order.symbol}")
-                print(f"    Side: {order.side.value.upper()}")
-                print(f"    Type: {order.order_type.value}")
-                print(f"    Quantity: {order.quantity}")
-                print(f"    Price: ${order.price:,.2f}")
-                print(f"    Status: {order.status.value.upper()}")
+            # One print per order, and only the first MAX_ORDERS_SHOWN of them
+            for i, order in enumerate(orders[:MAX_ORDERS_SHOWN], 1):
+                print(
+                    f"\n[{i}] Order ID: {order.order_id}\n"
+                    f"    Symbol: {order.symbol}\n"
+                    f"    Side: {order.side.value.upper()}\n"
+                    f"    Type: {order.order_type.value}\n"
+                    f"    Quantity: {order.quantity}\n"
+                    f"    Price: ${order.price:,.2f}\n"
+                    f"    Status: {order.status.value.upper()}"
+                )
+            if len(orders) > MAX_ORDERS_SHOWN:
+                print(f"\n... and {len(orders) - MAX_ORDERS_SHOWN} more")
 
     except Exception as e:
         print(f"Error: {e}")
 
 
+async def main():
+    """Place the test order, then list open orders, on one event loop"""
+    orders_task = await test_buy_eth()
+    await show_open_orders(orders_task=orders_task)
+
+
 if __name__ == "__main__":
     print("\n🚀 CoinDCX Futures Test Script [AUTO MODE]")
     print("Using new exchange integration system")
@@ -161,8 +212,10 @@ if __name__ == "__main__":
         print("  COINDCX_API_SECRET=your_api_secret")
         sys.exit(1)
 
-    # Run the test
-    asyncio.run(test_buy_eth())
-
-    # Show open orders
-    asyncio.run(show_open_orders())
+    # Run the test and show open orders in one event loop; tracebacks are
+    # written by a logging thread, off the event loop
+    listener = start_queue_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()
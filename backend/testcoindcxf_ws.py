@@ -4,153 +4,282 @@ Subscribes to real-time order updates via WebSocket
 """
 
 import asyncio
+import logging
+import random
 import sys
 import os
+import time
+from collections import deque
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, Any
+import orjson
 import socketio
 
 # Add the app directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.exchanges.coindcx.client import CoinDCXFutures
+from app.exchanges.coindcx.client import CoinDCXFutures, OrjsonCodec
+from app.core.log_queue import start_queue_logging
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# WS_DEBUG=1 turns on python-socketio / engine.io frame logging (off by default:
+# it formats and writes every frame)
+WS_DEBUG = os.getenv("WS_DEBUG") == "1"
+
+# Max formatted event blocks waiting for the printer before the oldest is dropped
+PRINT_QUEUE_MAXSIZE = 1024
+
+# Order ids remembered from recent updates, for expect_order
+RECENT_ORDER_IDS = 64
+
+# Keepalive ping interval, jittered so reconnecting clients don't ping in lockstep
+PING_INTERVAL = 25
+PING_JITTER = 5
+
+# Separator line for the event blocks
+_RULE = '=' * 70
+
+# The socketio codec only decodes the outer frame: CoinDCX nests each payload
+# as a JSON string inside it, so that is decoded per event (also with orjson)
+_loads = orjson.loads
+
+
+# Last formatted wall-clock second: [epoch second, "HH:MM:SS"]
+_hms_cache = [None, ""]
+
+
+def _hms(second: int) -> str:
+    """Local "HH:MM:SS" for an epoch second, formatted at most once per second"""
+    if second != _hms_cache[0]:
+        _hms_cache[0] = second
+        _hms_cache[1] = time.strftime('%H:%M:%S', time.localtime(second))
+    return _hms_cache[1]
+
+
+def _timestamp() -> str:
+    """Local "HH:MM:SS.mmm" for now (strftime only runs when the second changes)"""
+    now = time.time()
+    second = int(now)
+    return f"{_hms(second)}.{int((now - second) * 1000):03d}"
+
+
+def _num(x) -> float:
+    """float(x), skipping the call for values orjson already decoded as floats (None/"" -> 0.0)"""
+    return x if type(x) is float else float(x or 0)
+
 
 class OrderUpdateMonitor:
     """Monitor real-time order updates from CoinDCX Futures"""
 
-    def __init__(self):
-        self.client = None
+    def __init__(self, client: CoinDCXFutures = None):
+        # An existing client (e.g. an exchange adapter's) can be shared
+        self.client = client
         self.sio = None
         self.order_count = 0
         self.position_count = 0
         self.balance_count = 0
-        self.event_count = 0
+        self.event_count = 0  # Unhandled events seen by the WS_DEBUG catch-all
+
+        # Set by stop(); start() and the ping task wait on it instead of polling
+        self._stop = asyncio.Event()
+
+        # Set once the 'join' subscription is sent, so callers can wait on the
+        # socket instead of sleeping a fixed time
+        self.connected = asyncio.Event()
+
+        # Order to watch for (see expect_order): pending_event is set on its first update.
+        # Recent ids cover an update that arrives before the REST response does.
+        self.pending_order_id = None
+        self.pending_event = asyncio.Event()
+        self._recent_order_ids = deque(maxlen=RECENT_ORDER_IDS)
+
+        # Handlers queue their formatted output; a printer task writes it, so the
+        # socketio receive path never blocks on a slow terminal or pipe
+        self._print_q: asyncio.Queue = asyncio.Queue(maxsize=PRINT_QUEUE_MAXSIZE)
+        self._printer_task = None
+
+    def expect_order(self, order_id: str):
+        """Watch for updates to order_id (pending_event is set on the first one)"""
+        self.pending_order_id = order_id
+        self.pending_event.clear()
+        if order_id in self._recent_order_ids:
+            self.pending_event.set()
+
+    def _emit(self, text: str):
+        """Queue one event's output for the printer task (drops the oldest when full)"""
+        try:
+            self._print_q.put_nowait(text)
+        except asyncio.QueueFull:
+            self._print_q.get_nowait()
+            self._print_q.put_nowait(text)
+
+    async def _printer(self):
+        """Write queued output, batching whatever has accumulated into one write"""
+        while True:
+            chunks = [await self._print_q.get()]
+            while not self._print_q.empty():
+                chunks.append(self._print_q.get_nowait())
+            sys.stdout.write("".join(chunks))
+            sys.stdout.flush()
+
+    def _flush_output(self):
+        """Write anything still queued (used on shutdown)"""
+        chunks = []
+        while not self._print_q.empty():
+            chunks.append(self._print_q.get_nowait())
+        if chunks:
+            sys.stdout.write("".join(chunks))
+            sys.stdout.flush()
 
     async def on_order_update(self, data: Dict[str, Any]):
         """Handle order update events"""
         self.order_count += 1
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-
-        print(f"\n{'='*70}")
-        print(f"🔔 ORDER UPDATE #{self.order_count} - {timestamp}")
-        print(f"{'='*70}")
+        timestamp = _timestamp()
 
         # Parse the order data - CoinDCX sends data as a JSON string
-        import json
         if isinstance(data, dict) and 'data' in data:
             # Data is a JSON string that needs parsing
-            order_list = json.loads(data['data'])
+            order_list = _loads(data['data'])
             order = order_list[0] if order_list else {}
         elif isinstance(data, dict) and 'order' in data:
             order = data['order']
         else:
             order = data
 
-        print(f"Order ID:      {order.get('id', 'N/A')}")
-        print(f"Pair:          {order.get('pair', 'N/A')}")
-        print(f"Side:          {order.get('side', 'N/A').upper()}")
-        print(f"Status:        {order.get('status', 'N/A').upper()}")
-        print(f"Order Type:    {order.get('order_type', 'N/A')}")
-        print(f"Price:         ${float(order.get('price', 0)):,.2f}")
-        print(f"Quantity:      {float(order.get('total_quantity', 0)):.8f}")
-        print(f"Filled:        {float(order.get('filled_quantity', 0)):.8f}")
-        print(f"Remaining:     {float(order.get('remaining_quantity', 0)):.8f}")
-        print(f"Leverage:      {order.get('leverage', 'N/A')}x")
+        # Bind the lookups once and build the whole block as one string
+        g = order.get
+        f = _num
+
+        order_id = g('id')
+        self._recent_order_ids.append(order_id)
+        if order_id is not None and order_id == self.pending_order_id:
+            self.pending_event.set()
+
+        lines = [
+            f"\n{_RULE}",
+            f"🔔 ORDER UPDATE #{self.order_count} - {timestamp}",
+            _RULE,
+            f"Order ID:      {g('id', 'N/A')}",
+            f"Pair:          {g('pair', 'N/A')}",
+            f"Side:          {g('side', 'N/A').upper()}",
+            f"Status:        {g('status', 'N/A').upper()}",
+            f"Order Type:    {g('order_type', 'N/A')}",
+            f"Price:         ${f(g('price', 0)):,.2f}",
+            f"Quantity:      {f(g('total_quantity', 0)):.8f}",
+            f"Filled:        {f(g('filled_quantity', 0)):.8f}",
+            f"Remaining:     {f(g('remaining_quantity', 0)):.8f}",
+            f"Leverage:      {g('leverage', 'N/A')}x",
+        ]
 
         # Show average fill price if available
-        if order.get('avg_price'):
-            avg_price = float(order.get('avg_price'))
+        avg_price = g('avg_price')
+        if avg_price:
+            avg_price = f(avg_price)
             if avg_price > 0:
-                print(f"Avg Price:     ${avg_price:,.2f}")
+                lines.append(f"Avg Price:     ${avg_price:,.2f}")
 
         # Show fee if available
-        if order.get('fee_amount'):
-            fee = float(order.get('fee_amount'))
+        fee = g('fee_amount')
+        if fee:
+            fee = f(fee)
             if fee > 0:
-                print(f"Fee:           ${fee:.4f}")
+                lines.append(f"Fee:           ${fee:.4f}")
 
         # Show timestamp
-        if order.get('created_at'):
-            print(f"Created:       {order.get('created_at')}")
+        created_at = g('created_at')
+        if created_at:
+            lines.append(f"Created:       {created_at}")
 
         # Show display message if available
-        if order.get('display_message'):
-            print(f"Message:       {order.get('display_message')}")
+        message = g('display_message')
+        if message:
+            lines.append(f"Message:       {message}")
 
-        print(f"{'='*70}\n")
+        lines.append(f"{_RULE}\n\n")
+        self._emit("\n".join(lines))
 
     async def on_position_update(self, data: Dict[str, Any]):
         """Handle position update events"""
         self.position_count += 1
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-
-        print(f"\n{'='*70}")
-        print(f"📊 POSITION UPDATE #{self.position_count} - {timestamp}")
-        print(f"{'='*70}")
+        timestamp = _timestamp()
 
         # Parse the position data - CoinDCX sends data as a JSON string
-        import json
         if isinstance(data, dict) and 'data' in data:
-            position_list = json.loads(data['data'])
+            position_list = _loads(data['data'])
             position = position_list[0] if position_list else {}
         elif isinstance(data, dict) and 'position' in data:
             position = data['position']
         else:
             position = data
 
-        print(f"Position ID:       {position.get('id', 'N/A')}")
-        print(f"Pair:              {position.get('pair', 'N/A')}")
-        print(f"Active Position:   {float(position.get('active_pos', 0)):.8f}")
-        print(f"Average Price:     ${float(position.get('avg_price', 0)):,.2f}")
-        print(f"Liquidation Price: ${float(position.get('liquidation_price', 0)):,.2f}")
-        print(f"Locked Margin:     ${float(position.get('locked_margin', 0)):,.2f}")
+        g = position.get
+        f = _num
+        lines = [
+            f"\n{_RULE}",
+            f"📊 POSITION UPDATE #{self.position_count} - {timestamp}",
+            _RULE,
+            f"Position ID:       {g('id', 'N/A')}",
+            f"Pair:              {g('pair', 'N/A')}",
+            f"Active Position:   {f(g('active_pos', 0)):.8f}",
+            f"Average Price:     ${f(g('avg_price', 0)):,.2f}",
+            f"Liquidation Price: ${f(g('liquidation_price', 0)):,.2f}",
+            f"Locked Margin:     ${f(g('locked_margin', 0)):,.2f}",
+        ]
 
         # Show unrealized PnL if available
-        if position.get('unrealized_pnl'):
-            pnl = float(position.get('unrealized_pnl'))
+        pnl = g('unrealized_pnl')
+        if pnl:
+            pnl = f(pnl)
             pnl_emoji = "🟢" if pnl > 0 else "🔴" if pnl < 0 else "⚪"
-            print(f"Unrealized PnL:    {pnl_emoji} ${pnl:,.2f}")
+            lines.append(f"Unrealized PnL:    {pnl_emoji} ${pnl:,.2f}")
 
-        print(f"{'='*70}\n")
+        lines.append(f"{_RULE}\n\n")
+        self._emit("\n".join(lines))
 
     async def on_balance_update(self, data: Dict[str, Any]):
         """Handle balance update events"""
         self.balance_count += 1
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-
-        print(f"\n{'='*70}")
-        print(f"💰 BALANCE UPDATE #{self.balance_count} - {timestamp}")
-        print(f"{'='*70}")
+        timestamp = _timestamp()
 
         # Parse the balance data - CoinDCX sends data as a JSON string
-        import json
         if isinstance(data, dict) and 'data' in data:
-            balance_list = json.loads(data['data'])
+            balance_list = _loads(data['data'])
             balance = balance_list[0] if balance_list else {}
         elif isinstance(data, dict) and 'balance' in data:
             balance = data['balance']
         else:
             balance = data
 
-        if balance.get('currency_short_name'):
-            print(f"Currency:          {balance.get('currency_short_name')}")
-        if balance.get('balance'):
-            print(f"Available:         ${float(balance.get('balance')):,.2f}")
-        if balance.get('locked_balance'):
-            print(f"Locked:            ${float(balance.get('locked_balance')):,.2f}")
-
-        print(f"{'='*70}\n")
+        g = balance.get
+        f = _num
+        lines = [
+            f"\n{_RULE}",
+            f"💰 BALANCE UPDATE #{self.balance_count} - {timestamp}",
+            _RULE,
+        ]
+
+        currency = g('currency_short_name')
+        if currency:
+            lines.append(f"Currency:          {currency}")
+        available = g('balance')
+        if available:
+            lines.append(f"Available:         ${f(available):,.2f}")
+        locked = g('locked_balance')
+        if locked:
+            lines.append(f"Locked:            ${f(locked):,.2f}")
+
+        lines.append(f"{_RULE}\n\n")
+        self._emit("\n".join(lines))
 
     async def on_any_event(self, event, data):
         """Catch-all handler for debugging"""
         self.event_count += 1
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        timestamp = _timestamp()
 
         print(f"\n[{timestamp}] 🔍 Event #{self.event_count}: {event}")
         if data:
@@ -159,18 +288,24 @@ class OrderUpdateMonitor:
     async def start(self):
         """Start WebSocket monitoring"""
         print("\n" + "="*70)
-        print("🚀 CoinDCX Futures WebSocket Monitor (Debug Mode)")
+        print(f"🚀 CoinDCX Futures WebSocket Monitor{' (Debug Mode)' if WS_DEBUG else ''}")
         print("="*70)
         print("\nInitializing WebSocket client...")
 
         try:
-            # Create CoinDCX client
-            self.client = CoinDCXFutures()
+            # Create CoinDCX client unless one was shared with us
+            if self.client is None:
+                self.client = CoinDCXFutures()
 
-            # Create SocketIO client with debugging
+            # Start the printer before any handler can queue output
+            self._printer_task = asyncio.create_task(self._printer())
+
+            # Create SocketIO client (frame logging only with WS_DEBUG=1) that
+            # decodes frames with orjson
             self.sio = socketio.AsyncClient(
-                logger=True,
-                engineio_logger=True
+                logger=WS_DEBUG,
+                engineio_logger=WS_DEBUG,
+                json=OrjsonCodec
             )
 
             # Register ALL event handlers BEFORE connecting
@@ -189,10 +324,11 @@ class OrderUpdateMonitor:
             async def handle_balance_update(data):
                 await self.on_balance_update(data)
 
-            # Catch-all handler for debugging
-            @self.sio.on('*')
-            async def catch_all(event, data):
-                await self.on_any_event(event, data)
+            # Catch-all handler for debugging (only with WS_DEBUG=1)
+            if WS_DEBUG:
+                @self.sio.on('*')
+                async def catch_all(event, data):
+                    await self.on_any_event(event, data)
 
             # Standard SocketIO events
             @self.sio.on('connect')
@@ -210,20 +346,25 @@ class OrderUpdateMonitor:
                     'apiKey': self.client.api_key
                 })
                 print("✅ Subscription request sent!")
+                self.connected.set()
 
             @self.sio.on('disconnect')
             async def on_disconnect():
+                self.connected.clear()
                 print("\n⚠️  Disconnected from WebSocket")
 
             @self.sio.on('connect_error')
             async def on_connect_error(data):
                 print(f"\n❌ Connection error: {data}")
 
-            # Connect to WebSocket
+            # Connect to WebSocket, warming the REST connection (used to cancel) meanwhile
             print(f"\nConnecting to {self.client.websocket_url}...")
-            await self.sio.connect(
-                self.client.websocket_url,
-                transports=['websocket']
+            await asyncio.gather(
+                self.sio.connect(
+                    self.client.websocket_url,
+                    transports=['websocket']
+                ),
+                self.client.warm_up()
             )
 
             print("\n" + "="*70)
@@ -232,24 +373,25 @@ class OrderUpdateMonitor:
             print("  • df-order-update (Order Updates)")
             print("  • df-position-update (Position Updates)")
             print("  • balance-update (Balance Updates)")
-            print("  • * (All Events - Debug)")
+            if WS_DEBUG:
+                print("  • * (All Events - Debug)")
             print("="*70)
 
             print("\n💡 Tips:")
             print("  • Place an order using: python3 testcoindcxf_auto.py")
-            print("  • All WebSocket events will be shown in debug mode")
+            print("  • Set WS_DEBUG=1 to show all WebSocket events (debug mode)")
             print("  • Press Ctrl+C to stop monitoring\n")
 
             print("="*70)
-            print("🔊 Listening for ALL WebSocket events...")
+            print(f"🔊 Listening for {'ALL ' if WS_DEBUG else ''}WebSocket events...")
             print("="*70)
 
             # Start ping task
             asyncio.create_task(self._ping_task())
 
-            # Keep the connection alive
-            while True:
-                await asyncio.sleep(1)
+            # Keep the connection alive until stop() is called
+            # (socketio reconnects on its own after a dropped connection)
+            await self._stop.wait()
 
         except KeyboardInterrupt:
             print("\n\n⏹️  Stopping monitor...")
@@ -257,23 +399,39 @@ class OrderUpdateMonitor:
 
         except Exception as e:
             print(f"\n❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("WebSocket monitor failed")
             await self.stop()
 
     async def _ping_task(self):
-        """Send periodic ping to keep WebSocket alive"""
-        while self.sio and self.sio.connected:
-            await asyncio.sleep(25)
+        """Send periodic ping to keep WebSocket alive (exits as soon as the monitor stops)"""
+        while not self._stop.is_set():
+            interval = PING_INTERVAL + random.uniform(-PING_JITTER, PING_JITTER)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            # Skip this round while disconnected (socketio reconnects on its own)
+            if not (self.sio and self.sio.connected):
+                continue
             try:
                 await self.sio.emit('ping', {'data': 'Ping message'})
-                print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 📡 Ping sent")
+                print(f"\n[{_hms(int(time.time()))}] 📡 Ping sent")
             except Exception as e:
+                # A transient send failure shouldn't end the keepalive
                 print(f"\n❌ Ping failed: {e}")
-                break
 
     async def stop(self):
         """Stop WebSocket monitoring"""
+        self._stop.set()
+        if self._printer_task:
+            self._printer_task.cancel()
+            self._printer_task = None
+        self._flush_output()
+        if self.client is not None:
+            self.client.close()
+            await self.client.aclose()
         if self.sio and self.sio.connected:
             await self.sio.disconnect()
 
@@ -281,7 +439,8 @@ class OrderUpdateMonitor:
             print("\n" + "="*70)
             print("📊 SUMMARY")
             print("="*70)
-            print(f"Total Events:      {self.event_count}")
+            total = self.order_count + self.position_count + self.balance_count + self.event_count
+            print(f"Total Events:      {total}")
             print(f"Order Updates:     {self.order_count}")
             print(f"Position Updates:  {self.position_count}")
             print(f"Balance Updates:   {self.balance_count}")
@@ -297,21 +456,21 @@ async def test_with_order_placement():
     print("🧪 WebSocket Test with Order Placement")
     print("="*70)
 
-    monitor = OrderUpdateMonitor()
+    from app.exchanges import ExchangeFactory, OrderRequest, OrderSide, OrderType
+
+    # One exchange (and HTTP session) for placing, monitoring and cancelling
+    exchange = await ExchangeFactory.create("coindcx")
+    monitor = OrderUpdateMonitor(client=exchange.client)
 
     # Start monitor in background
     monitor_task = asyncio.create_task(monitor.start())
 
-    # Wait for connection
-    await asyncio.sleep(3)
-
     try:
-        # Import exchange factory
-        from app.exchanges import ExchangeFactory, OrderRequest, OrderSide, OrderType
+        # Wait for the connection and channel subscription
+        await asyncio.wait_for(monitor.connected.wait(), timeout=10)
 
         # Place a test order
         print("\n[TEST] Placing test order...")
-        exchange = await ExchangeFactory.create("coindcx")
 
         order = OrderRequest(
             symbol="ETH/USDT",
@@ -325,14 +484,18 @@ async def test_with_order_placement():
         response = await exchange.place_order(order)
         print(f"✅ Order placed! ID: {response.order_id}")
 
-        # Wait for updates
-        print("\n[TEST] Waiting 10 seconds for WebSocket updates...")
-        await asyncio.sleep(10)
+        # Wait for updates (up to 10 seconds for the first update to this order)
+        print("\n[TEST] Waiting up to 10 seconds for WebSocket updates...")
+        monitor.expect_order(response.order_id)
+        try:
+            await asyncio.wait_for(monitor.pending_event.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            print("⚠️  No update for this order received within 10 seconds")
 
         # Cancel the order using the client directly
         print("\n[TEST] Cancelling test order...")
         cancel_client = monitor.client
-        cancel_result = cancel_client.cancel_order(response.order_id)
+        cancel_result = await cancel_client.cancel_order_async(response.order_id)
         print(f"✅ Order cancelled! Result: {cancel_result}")
 
         # Wait a bit more
@@ -344,8 +507,7 @@ async def test_with_order_placement():
 
     except Exception as e:
         print(f"\n❌ Test error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("WebSocket order test failed")
         await monitor.stop()
 
 
@@ -361,14 +523,21 @@ if __name__ == "__main__":
     # Get mode from command line
     mode = sys.argv[1] if len(sys.argv) > 1 else "monitor"
 
-    if mode == "test":
-        # Test mode: place order and monitor
-        asyncio.run(test_with_order_placement())
-    elif mode == "monitor":
-        # Monitor mode: just listen for updates
-        monitor = OrderUpdateMonitor()
-        asyncio.run(monitor.start())
-    else:
+    if mode not in ("test", "monitor"):
         print(f"\n❌ Error: Unknown mode '{mode}'")
         print("\nUsage: python3 testcoindcxf_ws.py [monitor|test]")
         sys.exit(1)
+
+    # Tracebacks are written by a logging thread, so the socketio receive
+    # path never blocks on stderr
+    listener = start_queue_logging()
+    try:
+        if mode == "test":
+            # Test mode: place order and monitor
+            asyncio.run(test_with_order_placement())
+        else:
+            # Monitor mode: just listen for updates
+            monitor = OrderUpdateMonitor()
+            asyncio.run(monitor.start())
+    finally:
+        listener.stop()